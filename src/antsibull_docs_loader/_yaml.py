@@ -10,6 +10,9 @@ YAML loading.
 
 from __future__ import annotations
 
+import collections
+import os
+import time
 import typing as t
 from pathlib import Path
 
@@ -22,6 +25,20 @@ try:
 except ImportError:  # pragma: no cover
     from yaml import SafeLoader as _SafeLoader
 
+# Files modified less than this many nanoseconds ago are not cached, since
+# another modification within the timestamp granularity of the filesystem
+# would not be noticed
+_RACY_THRESHOLD_NS = 2_000_000_000
+
+# Maximal number of parsed files kept in the cache
+_CACHE_SIZE = 256
+
+# Maps (device, inode) of a file to (mtime in ns, size, parsed content),
+# least recently used first
+_CACHE: collections.OrderedDict[tuple[int, int], tuple[int, int, t.Any]] = (
+    collections.OrderedDict()
+)
+
 
 def load_yaml_file(path: Path) -> t.Any:
     """
@@ -29,3 +46,28 @@ def load_yaml_file(path: Path) -> t.Any:
     """
     with path.open("rb") as stream:
         return yaml.load(stream, Loader=_SafeLoader)
+
+
+def load_yaml_file_cached(path: Path) -> t.Any:
+    """
+    Load and parse YAML file ``path``, re-using earlier results if the file
+    did not change since then. Only the results for the most recently used
+    files are kept.
+
+    The result is shared between all callers and is read-only: modifying it
+    would also change the result of later calls for the same file. Callers
+    that need to modify it must copy it first.
+    """
+    stat = os.stat(path)
+    key = (stat.st_dev, stat.st_ino)
+    entry = _CACHE.get(key)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        _CACHE.move_to_end(key)
+        return entry[2]
+    data = load_yaml_file(path)
+    if time.time_ns() - stat.st_mtime_ns >= _RACY_THRESHOLD_NS:
+        _CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+        _CACHE.move_to_end(key)
+        if len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return data
@@ -79,17 +79,70 @@ EDA_PLUGIN_TYPES: tuple[EdaPluginType, ...] = (
     "eda_event_source",
 )
 
-_EDA_DIRECTORIES: Mapping[EdaPluginType, str] = {
-    "eda_event_filter": "extensions/eda/plugins/event_filter",
-    "eda_event_source": "extensions/eda/plugins/event_source",
+_EDA_DIRECTORIES: Mapping[EdaPluginType, Path] = {
+    "eda_event_filter": Path("extensions", "eda", "plugins", "event_filter"),
+    "eda_event_source": Path("extensions", "eda", "plugins", "event_source"),
 }
 
-ALL_DOCUMENTABLE_PLUGIN_TYPES: tuple[DocumentablePluginType, ...] = tuple(
-    sorted(CORE_DOCUMENTABLE_PLUGIN_TYPES + EDA_PLUGIN_TYPES)  # type: ignore
+# Plugin directories relative to the ansible-core / collection root
+_CORE_PLUGIN_DIRECTORIES: Mapping[PluginType, Path] = {
+    plugin_type: (
+        Path("modules") if plugin_type == "module" else Path("plugins", plugin_type)
+    )
+    for plugin_type in CORE_DOCUMENTABLE_PLUGIN_TYPES + CORE_OTHER_PLUGIN_TYPES
+}
+_COLLECTION_PLUGIN_DIRECTORIES: Mapping[PluginType, Path] = {
+    **{
+        plugin_type: Path(
+            "plugins", "modules" if plugin_type == "module" else plugin_type
+        )
+        for plugin_type in CORE_DOCUMENTABLE_PLUGIN_TYPES + CORE_OTHER_PLUGIN_TYPES
+    },
+    **_EDA_DIRECTORIES,  # type: ignore
+}
+
+ALL_DOCUMENTABLE_PLUGIN_TYPES: tuple[DocumentablePluginType, ...] = (
+    "become",
+    "cache",
+    "callback",
+    "cliconf",
+    "connection",
+    "eda_event_filter",
+    "eda_event_source",
+    "filter",
+    "httpapi",
+    "inventory",
+    "lookup",
+    "module",
+    "netconf",
+    "shell",
+    "strategy",
+    "test",
+    "vars",
 )
 
-ALL_PLUGIN_TYPES: tuple[PluginType, ...] = tuple(
-    sorted(ALL_DOCUMENTABLE_PLUGIN_TYPES + CORE_OTHER_PLUGIN_TYPES)
+ALL_PLUGIN_TYPES: tuple[PluginType, ...] = (
+    "action",
+    "become",
+    "cache",
+    "callback",
+    "cliconf",
+    "connection",
+    "doc_fragments",
+    "eda_event_filter",
+    "eda_event_source",
+    "filter",
+    "httpapi",
+    "inventory",
+    "lookup",
+    "module",
+    "module_utils",
+    "netconf",
+    "plugin_utils",
+    "shell",
+    "strategy",
+    "test",
+    "vars",
 )
 
 
@@ -101,24 +154,16 @@ def get_plugin_directory(collection: CollectionInfo, plugin_type: PluginType) ->
     a ValueError is raised. This can only happen for valid ``PluginType`` values
     if ``collection.is_ansible_core`` is true.
     """
-    if plugin_type == "module":
-        if collection.is_ansible_core:
-            return collection.path / "modules"
-        return collection.path / "plugins" / "modules"
-    if (
-        plugin_type in CORE_DOCUMENTABLE_PLUGIN_TYPES
-        or plugin_type in CORE_OTHER_PLUGIN_TYPES
-    ):
-        return collection.path / "plugins" / plugin_type
     if not collection.is_ansible_core:
-        directory: str | None = _EDA_DIRECTORIES.get(plugin_type)  # type: ignore
+        directory = _COLLECTION_PLUGIN_DIRECTORIES.get(plugin_type)
         if directory is not None:
             return collection.path / directory
-    what = (
-        "ansible-core"
-        if collection.is_ansible_core
-        else f"collection {collection.full_name}"
-    )
+        what = f"collection {collection.full_name}"
+    else:
+        directory = _CORE_PLUGIN_DIRECTORIES.get(plugin_type)
+        if directory is not None:
+            return collection.path / directory
+        what = "ansible-core"
     raise ValueError(f"Unknown plugin type {plugin_type!r} for {what}")
 
 
@@ -14,19 +14,60 @@ import os
 import re
 import subprocess
 import typing as t
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 
 from .data import CollectionInfo
 
-_ANSIBLE_VERSION_NEW = re.compile(
-    r"^ansible(?:-[a-z0-9]+)? \[(?:core|base) ([0-9][^\]]+)\]"
+_ANSIBLE_VERSION = re.compile(
+    r"^ansible(?:-[a-z0-9]+)? (?:\[(?:core|base) ([0-9][^\]\n]+)\]|([0-9][^\s]+))",
+    re.MULTILINE,
+)
+_MODULE_LOCATION = re.compile(
+    r"^[^\S\n]*ansible python module location([^\n]*)", re.MULTILINE
 )
-_ANSIBLE_VERSION_OLD = re.compile(r"^ansible(?:-[a-z0-9]+)? ([0-9][^\s]+)")
 
 _COLLECTIONS_PATH_ENV_VAR = "ANSIBLE_COLLECTIONS_PATH"
 _COLLECTIONS_PATH_ENV_VAR_COMPAT = "ANSIBLE_COLLECTIONS_PATHS"
 
+# Environment variables that prevent ansible-galaxy from loading local plugins
+_NULL_PLUGIN_ENV: Mapping[str, str] = {
+    "ANSIBLE_ACTION_PLUGINS": "/dev/null",
+    "ANSIBLE_CACHE_PLUGINS": "/dev/null",
+    "ANSIBLE_CALLBACK_PLUGINS": "/dev/null",
+    "ANSIBLE_CLICONF_PLUGINS": "/dev/null",
+    "ANSIBLE_CONNECTION_PLUGINS": "/dev/null",
+    "ANSIBLE_FILTER_PLUGINS": "/dev/null",
+    "ANSIBLE_HTTPAPI_PLUGINS": "/dev/null",
+    "ANSIBLE_INVENTORY_PLUGINS": "/dev/null",
+    "ANSIBLE_LOOKUP_PLUGINS": "/dev/null",
+    "ANSIBLE_LIBRARY": "/dev/null",
+    "ANSIBLE_MODULE_UTILS": "/dev/null",
+    "ANSIBLE_NETCONF_PLUGINS": "/dev/null",
+    "ANSIBLE_ROLES_PATH": "/dev/null",
+    "ANSIBLE_STRATEGY_PLUGINS": "/dev/null",
+    "ANSIBLE_TERMINAL_PLUGINS": "/dev/null",
+    "ANSIBLE_TEST_PLUGINS": "/dev/null",
+    "ANSIBLE_VARS_PLUGINS": "/dev/null",
+    "ANSIBLE_DOC_FRAGMENT_PLUGINS": "/dev/null",
+}
+
+# Environment variables passed to ansible-galaxy when a minimal environment is
+# requested (in addition to all ANSIBLE_* variables)
+_PASSTHROUGH_ENV_VARS: frozenset[str] = frozenset(
+    (
+        "HOME",
+        "LANG",
+        "LC_ALL",
+        "PATH",
+        "PYTHONPATH",
+        "SSH_AUTH_SOCK",
+        "TMPDIR",
+        "USER",
+        "VIRTUAL_ENV",
+    )
+)
+
 
 class Runner(t.Protocol):
     """
@@ -63,14 +104,15 @@ class Ansible29Error(ListingCollectionsError):
 def _extract_ansible_builtin_collection(stdout: str) -> CollectionInfo:
     path: Path | None = None
     version: str | None = None
-    for line in stdout.splitlines():
-        if line.strip().startswith("ansible python module location"):
-            path = Path(line.split("=", 2)[1].strip())
-        for regex in (_ANSIBLE_VERSION_NEW, _ANSIBLE_VERSION_OLD):
-            match = regex.match(line)
-            if match:
-                version = match.group(1)
-                break
+    # If a line occurs more than once, the last occurrence wins
+    locations = _MODULE_LOCATION.findall(stdout)
+    if locations:
+        _, separator, location = locations[-1].partition("=")
+        if separator:
+            path = Path(location.strip())
+    versions = _ANSIBLE_VERSION.findall(stdout)
+    if versions:
+        version = versions[-1][0] or versions[-1][1]
     if path is None:
         raise ListingCollectionsError(
             f"Cannot extract module location path from ansible --version output: {stdout}"
@@ -142,49 +184,47 @@ def _ansible_galaxy_list_collections_compat(
             f" Standard error output: {stderr.decode('utf-8')}"
         )
     root: Path | None = None
-    for line in stdout.decode("utf-8").splitlines():
+    for line in stdout.splitlines():
         parts = line.split(maxsplit=1)
         if len(parts) < 2:
             continue
-        if parts[0] == "#":
-            root = Path(parts[1])
+        if parts[0] == b"#":
+            root = Path(parts[1].decode("utf-8"))
         elif root is not None:
-            yield from _yield_collection(parts[0], parts[1].strip(), root)
+            yield from _yield_collection(
+                parts[0].decode("utf-8"), parts[1].strip().decode("utf-8"), root
+            )
 
 
 def _prepare_env(
     *,
     collections_path: str | None,
     only_pass_env_updates: bool = False,
+    minimal_env: bool = False,
     compat: bool = False,
 ) -> dict[str, str] | None:
-    env: dict[str, str] = {} if only_pass_env_updates else os.environ.copy()
-    env.update(
-        {
-            "ANSIBLE_ACTION_PLUGINS": "/dev/null",
-            "ANSIBLE_CACHE_PLUGINS": "/dev/null",
-            "ANSIBLE_CALLBACK_PLUGINS": "/dev/null",
-            "ANSIBLE_CLICONF_PLUGINS": "/dev/null",
-            "ANSIBLE_CONNECTION_PLUGINS": "/dev/null",
-            "ANSIBLE_FILTER_PLUGINS": "/dev/null",
-            "ANSIBLE_HTTPAPI_PLUGINS": "/dev/null",
-            "ANSIBLE_INVENTORY_PLUGINS": "/dev/null",
-            "ANSIBLE_LOOKUP_PLUGINS": "/dev/null",
-            "ANSIBLE_LIBRARY": "/dev/null",
-            "ANSIBLE_MODULE_UTILS": "/dev/null",
-            "ANSIBLE_NETCONF_PLUGINS": "/dev/null",
-            "ANSIBLE_ROLES_PATH": "/dev/null",
-            "ANSIBLE_STRATEGY_PLUGINS": "/dev/null",
-            "ANSIBLE_TERMINAL_PLUGINS": "/dev/null",
-            "ANSIBLE_TEST_PLUGINS": "/dev/null",
-            "ANSIBLE_VARS_PLUGINS": "/dev/null",
-            "ANSIBLE_DOC_FRAGMENT_PLUGINS": "/dev/null",
+    env: dict[str, str]
+    if only_pass_env_updates:
+        env = dict(_NULL_PLUGIN_ENV)
+    elif minimal_env:
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if key in _PASSTHROUGH_ENV_VARS or key.startswith("ANSIBLE_")
         }
-    )
+        env.update(_NULL_PLUGIN_ENV)
+    else:
+        env = {**os.environ, **_NULL_PLUGIN_ENV}
     if collections_path:
-        env["ANSIBLE_COLLECTIONS_PATH"] = collections_path
         if compat:
-            env["_COLLECTIONS_PATH_ENV_VAR_COMPAT"] = collections_path
+            env.update(
+                {
+                    _COLLECTIONS_PATH_ENV_VAR: collections_path,
+                    _COLLECTIONS_PATH_ENV_VAR_COMPAT: collections_path,
+                }
+            )
+        else:
+            env[_COLLECTIONS_PATH_ENV_VAR] = collections_path
     return env if env or not only_pass_env_updates else None
 
 
@@ -193,9 +233,15 @@ def ansible_galaxy_list_collections(
     *,
     collections_path: str | None = None,
     only_pass_env_updates: bool = False,
+    minimal_env: bool = False,
 ) -> Iterator[CollectionInfo]:
     """
     Use 'ansible-galaxy collection list' to list all collections.
+
+    If ``minimal_env`` is true, only a small set of environment variables
+    (like ``PATH``, ``HOME``, and all ``ANSIBLE_*`` variables) is passed on
+    instead of the whole environment. This is ignored if
+    ``only_pass_env_updates`` is true.
     """
     try:
         stdout, stderr, rc = runner(
@@ -203,6 +249,7 @@ def ansible_galaxy_list_collections(
             env=_prepare_env(
                 collections_path=collections_path,
                 only_pass_env_updates=only_pass_env_updates,
+                minimal_env=minimal_env,
             ),
         )
         if (
@@ -221,6 +268,7 @@ def ansible_galaxy_list_collections(
                 env=_prepare_env(
                     collections_path=collections_path,
                     only_pass_env_updates=only_pass_env_updates,
+                    minimal_env=minimal_env,
                     compat=True,
                 ),
             )
@@ -236,13 +284,7 @@ def ansible_galaxy_list_collections(
                 f"Unexpected return code {rc} when listing collections."
                 f" Standard error output: {stderr.decode('utf-8')}"
             )
-        data = json.loads(stdout)
-        for collections_root_path, collections in data.items():
-            root = Path(collections_root_path)
-            for collection_name, collection_data in collections.items():
-                yield from _yield_collection(
-                    collection_name, collection_data.get("version"), root
-                )
+        yield from _parse_collection_list_json(stdout)
     except ListingCollectionsError:
         raise
     except Exception as exc:
@@ -251,4 +293,14 @@ def ansible_galaxy_list_collections(
         ) from exc
 
 
+def _parse_collection_list_json(stdout: bytes) -> Iterator[CollectionInfo]:
+    data = json.loads(stdout)
+    for collections_root_path, collections in data.items():
+        root = Path(collections_root_path)
+        for collection_name, collection_data in collections.items():
+            yield from _yield_collection(
+                collection_name, collection_data.get("version"), root
+            )
+
+
 __all__ = ("ansible_galaxy_list_collections", "locate_ansible_builtin_collection")
@@ -10,11 +10,18 @@ Data structures.
 from __future__ import annotations
 
 import dataclasses
+import sys
+import typing as t
 from collections.abc import Iterable
 from pathlib import Path
 
+# Dataclasses only support slots=True from Python 3.10 on
+_DATACLASS_SLOTS: dict[str, t.Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CollectionInfo:
     path: Path
     namespace: str
@@ -24,32 +31,33 @@ class CollectionInfo:
     is_ansible_core: bool = False
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CollectionInfos:
     ansible_core: CollectionInfo | None
     collections: dict[str, CollectionInfo]
 
     @staticmethod
     def build(collections: Iterable[CollectionInfo]) -> CollectionInfos:
-        ansible_core: CollectionInfo | None = None
-        name_to_coll: dict[str, CollectionInfo] = {}
-        cores = [collection for collection in collections if collection.is_ansible_core]
+        cores: list[CollectionInfo] = []
+        others: dict[str, CollectionInfo] = {}
+        for collection in collections:
+            if collection.is_ansible_core:
+                cores.append(collection)
+            elif collection.full_name not in ("ansible.builtin", "ansible.legacy"):
+                others.setdefault(collection.full_name, collection)
         if len(cores) > 1:
             raise ValueError(
                 "Found more than one collection claiming to be ansible-core"
             )
         ansible_core = cores[0] if cores else None
+        name_to_coll = others
         if ansible_core:
             if ansible_core.full_name != "ansible.builtin":
                 raise ValueError(
                     f"Ansible-core has wrong full name {ansible_core.full_name!r}"
                 )
-            name_to_coll[ansible_core.full_name] = ansible_core
-        for collection in collections:
-            if collection.full_name in ("ansible.builtin", "ansible.legacy"):
-                continue
-            if collection.full_name not in name_to_coll:
-                name_to_coll[collection.full_name] = collection
+            # ansible.builtin always comes first
+            name_to_coll = {ansible_core.full_name: ansible_core, **others}
         return CollectionInfos(
             ansible_core=ansible_core,
             collections=name_to_coll,
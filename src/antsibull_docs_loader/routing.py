@@ -11,37 +11,54 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import functools
+import sys
 import types
 import typing as t
 from collections.abc import Mapping
 from pathlib import Path
 
-from ._yaml import load_yaml_file as _load_yaml_file
+# The loaded YAML data is shared between callers and must not be modified
+from ._yaml import load_yaml_file_cached as _load_yaml_file
 from .ansible import (
     CORE_DOCUMENTABLE_PLUGIN_TYPES,
     CORE_OTHER_PLUGIN_TYPES,
     EDA_PLUGIN_TYPES,
 )
+from .data import _DATACLASS_SLOTS
 
 if t.TYPE_CHECKING:
     from .ansible import PluginType
     from .data import CollectionInfo, CollectionInfos
 
 
-_CORE_ROUTING_INFO = "config/ansible_builtin_runtime.yml"
-_COLLECTION_ROUTING_INFO = "meta/runtime.yml"
+_CORE_ROUTING_INFO = Path("config", "ansible_builtin_runtime.yml")
+_COLLECTION_ROUTING_INFO = Path("meta", "runtime.yml")
 # EDA docs: https://docs.ansible.com/projects/rulebook/en/latest/plugin_lifecycle.html
-_COLLECTION_EDA_ROUTING_INFO = "extensions/eda/eda_runtime.yml"
+_COLLECTION_EDA_ROUTING_INFO = Path("extensions", "eda", "eda_runtime.yml")
 
+# Maps plugin type names used in routing files to plugin types
+_PLUGIN_TYPE_NAMES: Mapping[str, PluginType] = {
+    "modules": "module",
+    **{plugin_type: plugin_type for plugin_type in CORE_DOCUMENTABLE_PLUGIN_TYPES},
+    **{plugin_type: plugin_type for plugin_type in CORE_OTHER_PLUGIN_TYPES},
+}
+_EDA_PLUGIN_TYPE_NAMES: Mapping[str, PluginType] = {
+    plugin_type[len("eda_") :]: plugin_type for plugin_type in EDA_PLUGIN_TYPES
+}
 
-@dataclasses.dataclass(frozen=True)
+# Sentinel for distinguishing missing keys from keys with value None
+_MISSING = object()
+
+
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class RemovalData:
     warning_text: str | None
     removal_version: str | None
     removal_date: datetime.date | str | None
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PluginRouting:
     action_plugin: str | None  # this is **only used for modules**!
     redirect: str | types.EllipsisType | None  # ellipsis == infinite loop
@@ -54,11 +71,26 @@ class PluginRouting:
     tombstone: RemovalData | None
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CollectionRouting:
     plugin_data: dict[PluginType, dict[str, PluginRouting]]
 
 
+# Most deprecations and tombstones share their (often empty) contents, so
+# hand out one immutable instance per distinct set of values
+@functools.lru_cache(maxsize=256)
+def _get_removal_data(
+    warning_text: str | None,
+    removal_version: str | None,
+    removal_date: datetime.date | str | None,
+) -> RemovalData:
+    return RemovalData(
+        warning_text=warning_text,
+        removal_version=removal_version,
+        removal_date=removal_date,
+    )
+
+
 def _load_removal_data(
     plugin_data: Mapping,
     *,
@@ -67,10 +99,12 @@ def _load_removal_data(
     plugin_name: str,
     typ: t.Literal["deprecation", "tombstone"],
 ) -> RemovalData | None:
-    if typ not in plugin_data:
+    removal_data = plugin_data.get(typ, _MISSING)
+    if removal_data is _MISSING:
         return None
-    removal_data = plugin_data.get(typ)
-    if not isinstance(removal_data, Mapping):
+    # YAML mappings are loaded as dicts; checking for dict first avoids the much
+    # slower isinstance() check against the Mapping ABC in the common case
+    if not isinstance(removal_data, dict) and not isinstance(removal_data, Mapping):
         raise ValueError(
             f"{typ.title()} for {plugin_type} {plugin_name} in {path}"
             f" must be a mapping, got {type(removal_data)}"
@@ -97,11 +131,7 @@ def _load_removal_data(
             f"{typ.title()} for {plugin_type} {plugin_name} in {path}"
             f" must have its removal_date a string or date, got {type(removal_date)}"
         )
-    return RemovalData(
-        warning_text=warning_text,
-        removal_version=removal_version,
-        removal_date=removal_date,
-    )
+    return _get_removal_data(warning_text, removal_version, removal_date)
 
 
 def _parse_plugin_data(
@@ -125,7 +155,7 @@ def _parse_plugin_data(
             deprecation=None,
             tombstone=None,
         )
-    if not isinstance(plugin_data, Mapping):
+    if not isinstance(plugin_data, dict) and not isinstance(plugin_data, Mapping):
         raise ValueError(
             f"Routing information for {plugin_type} {plugin_name} in {path}"
             f" must be a mapping, got {type(plugin_data)}"
@@ -144,7 +174,6 @@ def _parse_plugin_data(
         plugin_name=plugin_name,
         typ="tombstone",
     )
-    plugin_fqcn = f"{own_name}.{plugin_name}"
     action_plugin: str | None = None
     redirect: str | types.EllipsisType | None = None
     redirect_chain: tuple[str, ...] | None = None
@@ -157,13 +186,16 @@ def _parse_plugin_data(
                 f"action_plugin for {plugin_type} {plugin_name} in {path}"
                 f" must be a string, got {type(action_plugin)}"
             )
-    if "redirect" in plugin_data:
-        redirect = plugin_data["redirect"]
-        if not isinstance(redirect, str):
+    redirect_value = plugin_data.get("redirect", _MISSING)
+    if redirect_value is not _MISSING:
+        if not isinstance(redirect_value, str):
             raise ValueError(
                 f"redirect for {plugin_type} {plugin_name} in {path}"
-                f" must be a string, got {type(redirect)}"
+                f" must be a string, got {type(redirect_value)}"
             )
+        # Redirect targets end up in many redirect chains; share the strings
+        redirect = sys.intern(redirect_value)
+        plugin_fqcn = f"{own_name}.{plugin_name}"
         if redirect == plugin_fqcn:
             # This is an obvious infinite loop
             redirect = ...
@@ -192,9 +224,9 @@ def _load_routing_information(
     get_real_plugin_type_name: t.Callable[[str], PluginType | None],
 ) -> dict[PluginType, dict[str, PluginRouting]]:
     if data is None:
-        # If the YAML file is empty, PyYAML returns None
-        data = {}
-    if not isinstance(data, Mapping):
+        # The file is missing, or it is empty (then PyYAML returns None)
+        return {}
+    if not isinstance(data, dict) and not isinstance(data, Mapping):
         raise ValueError(
             f"Runtime information in {path} must have a top-level mapping, got {type(data)}"
         )
@@ -202,7 +234,7 @@ def _load_routing_information(
     plugin_routing = data.get("plugin_routing")
     if plugin_routing is None:
         return result
-    if not isinstance(plugin_routing, Mapping):
+    if not isinstance(plugin_routing, dict) and not isinstance(plugin_routing, Mapping):
         raise ValueError(
             f"Plugin routing information in {path} must be a mapping, got {type(plugin_routing)}"
         )
@@ -212,7 +244,7 @@ def _load_routing_information(
             continue
         if not plugins_data:
             continue
-        if not isinstance(plugins_data, Mapping):
+        if not isinstance(plugins_data, dict) and not isinstance(plugins_data, Mapping):
             raise ValueError(
                 f"Plugin routing information in {path} for type {plugin_type}"
                 f" must be a mapping, got {type(plugins_data)}"
@@ -232,69 +264,46 @@ def _load_routing_information(
 
 
 def _get_real_plugin_type_name(name: str) -> PluginType | None:
-    if name == "modules":
-        return "module"
-    if name in CORE_DOCUMENTABLE_PLUGIN_TYPES:
-        return name  # type: ignore
-    if name in CORE_OTHER_PLUGIN_TYPES:
-        return name  # type: ignore
-    return None
+    return _PLUGIN_TYPE_NAMES.get(name)
 
 
-def _load_core_routing_information(
-    path: Path,
-) -> dict[PluginType, dict[str, PluginRouting]]:
-    routing_path = path / _CORE_ROUTING_INFO
+def _load_optional_yaml_file(path: Path) -> t.Any:
     try:
-        data = _load_yaml_file(routing_path)
+        return _load_yaml_file(path)
     except FileNotFoundError:
-        # This should only happen for Ansible 2.9
-        return {}
-    return _load_routing_information(
-        data,
-        path=routing_path,
-        own_name="ansible.builtin",
-        get_real_plugin_type_name=_get_real_plugin_type_name,
-    )
+        # For ansible-core, this should only happen for Ansible 2.9
+        return None
 
 
-def _load_collection_routing_information(
-    collection_info: CollectionInfo,
-) -> dict[PluginType, dict[str, PluginRouting]]:
-    path = collection_info.path / _COLLECTION_ROUTING_INFO
-    try:
-        data = _load_yaml_file(path)
-    except FileNotFoundError:
-        return {}
-    return _load_routing_information(
-        data,
-        path=path,
+def _convert_routing_information(
+    collection_info: CollectionInfo, *, runtime_data: t.Any, eda_data: t.Any
+) -> CollectionRouting:
+    if collection_info.is_ansible_core:
+        return CollectionRouting(
+            plugin_data=_load_routing_information(
+                runtime_data,
+                path=collection_info.path / _CORE_ROUTING_INFO,
+                own_name="ansible.builtin",
+                get_real_plugin_type_name=_get_real_plugin_type_name,
+            )
+        )
+    result = _load_routing_information(
+        runtime_data,
+        path=collection_info.path / _COLLECTION_ROUTING_INFO,
         own_name=collection_info.full_name,
         get_real_plugin_type_name=_get_real_plugin_type_name,
     )
-
-
-def _load_eda_routing_information(
-    collection_info: CollectionInfo,
-) -> dict[PluginType, dict[str, PluginRouting]]:
-    path = collection_info.path / _COLLECTION_EDA_ROUTING_INFO
-    try:
-        data = _load_yaml_file(path)
-    except FileNotFoundError:
-        return {}
-
-    def get_real_plugin_type_name(name: str) -> PluginType | None:
-        trans_name = f"eda_{name}"
-        if trans_name in EDA_PLUGIN_TYPES:
-            return trans_name  # type: ignore
-        return None
-
-    return _load_routing_information(
-        data,
-        path=path,
-        own_name=collection_info.full_name,
-        get_real_plugin_type_name=get_real_plugin_type_name,
-    )
+    if eda_data is not None:
+        # Most collections do not have EDA plugins
+        result.update(
+            _load_routing_information(
+                eda_data,
+                path=collection_info.path / _COLLECTION_EDA_ROUTING_INFO,
+                own_name=collection_info.full_name,
+                get_real_plugin_type_name=_EDA_PLUGIN_TYPE_NAMES.get,
+            )
+        )
+    return CollectionRouting(plugin_data=result)
 
 
 def load_routing_information(collection_info: CollectionInfo) -> CollectionRouting:
@@ -304,13 +313,22 @@ def load_routing_information(collection_info: CollectionInfo) -> CollectionRouti
     Note that most of the routing information is not yet present.
     """
     if collection_info.is_ansible_core:
-        return CollectionRouting(
-            plugin_data=_load_core_routing_information(collection_info.path)
+        return _convert_routing_information(
+            collection_info,
+            runtime_data=_load_optional_yaml_file(
+                collection_info.path / _CORE_ROUTING_INFO
+            ),
+            eda_data=None,
         )
-    result = {}
-    result.update(_load_collection_routing_information(collection_info))
-    result.update(_load_eda_routing_information(collection_info))
-    return CollectionRouting(plugin_data=result)
+    return _convert_routing_information(
+        collection_info,
+        runtime_data=_load_optional_yaml_file(
+            collection_info.path / _COLLECTION_ROUTING_INFO
+        ),
+        eda_data=_load_optional_yaml_file(
+            collection_info.path / _COLLECTION_EDA_ROUTING_INFO
+        ),
+    )
 
 
 def collect_routing_information(
@@ -343,6 +361,27 @@ def collect_routing_information(
     return result
 
 
+# Redirect targets are shared by many plugins, so cache splitting them into
+# collection name and plugin name
+@functools.lru_cache(maxsize=4096)
+def _split_fqcn(fqcn: str) -> tuple[str, str] | None:
+    namespace_end = fqcn.find(".")
+    if namespace_end < 0:
+        return None
+    collection_end = fqcn.find(".", namespace_end + 1)
+    if collection_end < 0:
+        return None
+    return sys.intern(fqcn[:collection_end]), fqcn[collection_end + 1 :]
+
+
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
+class _RedirectHop:
+    fqcn: str
+    plugin_name: str
+    plugin_data: PluginRouting | None
+    owner: dict[str, PluginRouting] | None
+
+
 def _complete_redirect(  # noqa: C901 # pylint: disable=too-many-branches
     plugin_data: PluginRouting,
     *,
@@ -354,12 +393,12 @@ def _complete_redirect(  # noqa: C901 # pylint: disable=too-many-branches
     if plugin_data.redirect in (None, ...) or plugin_data.redirect_chain is not None:
         # Already done!
         return plugin_data
-    fqcn = f"{collection_name}.{plugin_name}"
-    found_names: set[str] = set()
-    found_names.add(fqcn)
-    redirection_list: list[
-        tuple[str, str, str, PluginRouting | None, dict[str, PluginRouting] | None]
-    ] = [(fqcn, collection_name, plugin_name, plugin_data, None)]
+    fqcn = sys.intern(f"{collection_name}.{plugin_name}")
+    # Maps names to their index in redirection_list
+    found_names: dict[str, int] = {fqcn: 0}
+    redirection_list: list[_RedirectHop] = [
+        _RedirectHop(fqcn, plugin_name, plugin_data, None)
+    ]
     next_name: str = plugin_data.redirect  # type: ignore # this is ensured further up
     redirect_chain: tuple[str, ...] | None = None
     redirect_deprecations: tuple[tuple[str, RemovalData], ...] | None = None
@@ -370,44 +409,37 @@ def _complete_redirect(  # noqa: C901 # pylint: disable=too-many-branches
     while True:
         if next_name in found_names:
             # We found a cycle!
-            start_index = next(
-                index
-                for index, elt in enumerate(redirection_list)
-                if elt[0] == next_name
-            )
+            start_index = found_names[next_name]
             is_loop = True
             redirect_error = "Detected circular redirect"
             loop = redirection_list[start_index:]
-            redirect_chain = tuple(elt[0] for elt in loop)
-            redirect_deprecations_w_index = tuple(
-                (index, (elt[0], elt[3].deprecation))
-                for index, elt in enumerate(loop)
-                if elt[3] is not None and elt[3].deprecation is not None
-            )
-            for index, (
-                plugin_fqcn,
-                _plugin_collection_name,
-                plugin_plugin_name,
-                plugin_plugin_data,
-                plugin_owner,
-            ) in enumerate(loop):
-                redirect_chain += (plugin_fqcn,)
+            loop_length = len(loop)
+            # The chain and deprecations of every loop member are rotations of
+            # the ones of the first member; take them from doubled lists
+            loop_fqcns = [hop.fqcn for hop in loop] * 2
+            loop_deprecations: list[tuple[str, RemovalData]] = []
+            loop_deprecation_starts: list[int] = []
+            for hop in loop:
+                loop_deprecation_starts.append(len(loop_deprecations))
+                if hop.plugin_data is not None and hop.plugin_data.deprecation:
+                    loop_deprecations.append((hop.fqcn, hop.plugin_data.deprecation))
+            deprecation_count = len(loop_deprecations)
+            loop_deprecations *= 2
+            for index, hop in enumerate(loop):
+                plugin_plugin_data = hop.plugin_data
                 if plugin_plugin_data is not None:
+                    deprecation_start = loop_deprecation_starts[index]
                     new_plugin_data = PluginRouting(
                         action_plugin=plugin_plugin_data.action_plugin,
                         redirect=...,
-                        redirect_chain=redirect_chain,
-                        redirect_deprecations=(
-                            tuple(
-                                elt
-                                for idx, elt in redirect_deprecations_w_index
-                                if idx >= index
-                            )
-                            + tuple(
-                                elt
-                                for idx, elt in redirect_deprecations_w_index
-                                if idx < index
-                            )
+                        redirect_chain=tuple(
+                            loop_fqcns[index : index + loop_length + 1]
+                        ),
+                        redirect_deprecations=tuple(
+                            loop_deprecations[
+                                deprecation_start : deprecation_start
+                                + deprecation_count
+                            ]
                         )
                         or None,
                         redirect_tombstone=False,
@@ -416,41 +448,38 @@ def _complete_redirect(  # noqa: C901 # pylint: disable=too-many-branches
                         deprecation=plugin_plugin_data.deprecation,
                         tombstone=plugin_plugin_data.tombstone,
                     )
-                    if plugin_owner:
-                        plugin_owner[plugin_plugin_name] = new_plugin_data
-                    if plugin_fqcn == fqcn:
+                    if hop.owner:
+                        hop.owner[hop.plugin_name] = new_plugin_data
+                    if hop.fqcn == fqcn:
                         plugin_data = new_plugin_data
                 else:
                     # This should never be reached
                     pass  # pragma: no cover
-                redirect_chain = redirect_chain[1:]
-            redirect_chain += (next_name,)
-            redirect_deprecations = (
-                tuple(elt for _index, elt in redirect_deprecations_w_index) or None
-            )
+            redirect_chain = tuple(loop_fqcns[: loop_length + 1])
+            redirect_deprecations = tuple(loop_deprecations[:deprecation_count]) or None
             redirection_list = redirection_list[:start_index]
             break
-        found_names.add(next_name)
-        parts = next_name.split(".", 2)
-        if len(parts) < 3:
+        found_names[next_name] = len(redirection_list)
+        parts = _split_fqcn(next_name)
+        if parts is None:
             redirect_dead_end = True
             redirect_error = f"Found redirect to non-FQCN {next_name}"
             break
-        next_ns, next_cn, next_pn = parts
-        next_coll = f"{next_ns}.{next_cn}"
-        if next_coll not in routing_data:
-            redirection_list.append((next_name, next_coll, next_pn, None, None))
+        next_coll, next_pn = parts
+        next_routing = routing_data.get(next_coll)
+        if next_routing is None:
+            redirection_list.append(_RedirectHop(next_name, next_pn, None, None))
             redirect_dead_end = True
             redirect_error = f"Found redirect to unknown collection {next_coll}"
             break
-        prd = routing_data[next_coll].plugin_data.get(plugin_type)
+        prd = next_routing.plugin_data.get(plugin_type)
         pd = prd.get(next_pn) if prd else None
         if pd is not None and pd.tombstone:
             redirect_deprecations = ((next_name, pd.tombstone),)
             redirect_tombstone = True
             break
         if pd is None or pd.redirect is None:
-            redirection_list.append((next_name, next_coll, next_pn, pd, None))
+            redirection_list.append(_RedirectHop(next_name, next_pn, pd, None))
             break
         if (
             pd.redirect_error is not None
@@ -464,55 +493,60 @@ def _complete_redirect(  # noqa: C901 # pylint: disable=too-many-branches
             redirect_error = pd.redirect_error
             is_loop = pd.redirect is ...
             break
+        if pd.redirect_chain is not None:
+            # The redirect of this plugin has already been completed, so
+            # re-use its result instead of walking the rest of the chain again
+            redirect_chain = pd.redirect_chain
+            redirect_deprecations = pd.redirect_deprecations
+            next_name = pd.redirect  # type: ignore # this is ensured further up
+            break
         if pd.redirect is ...:
             raise AssertionError(  # pragma: no cover
                 "Bad internal state: circular redirect should have been marked as an error"
             )
-        redirection_list.append((next_name, next_coll, next_pn, pd, prd))
+        redirection_list.append(_RedirectHop(next_name, next_pn, pd, prd))
         next_name = pd.redirect
-    max_index = len(redirection_list) - 1
-    for index, (
-        plugin_fqcn,
-        _plugin_collection_name,
-        plugin_plugin_name,
-        plugin_plugin_data,
-        plugin_owner,
-    ) in enumerate(reversed(redirection_list)):
-        index = max_index - index
-        redirect_chain = (plugin_fqcn,) + (redirect_chain or ())
+    # Build the chain and the deprecations of the first hop once; the ones of
+    # the later hops are suffixes of these
+    chain = tuple(hop.fqcn for hop in redirection_list) + (redirect_chain or ())
+    deprecations: list[tuple[str, RemovalData]] = []
+    deprecation_starts: list[int] = []
+    for hop in redirection_list:
+        deprecation_starts.append(len(deprecations))
+        if hop.plugin_data is not None and hop.plugin_data.deprecation:
+            deprecations.append((hop.fqcn, hop.plugin_data.deprecation))
+    deprecations.extend(redirect_deprecations or ())
+    redirect: str | types.EllipsisType = ... if is_loop else next_name
+    for index, hop in enumerate(redirection_list):
+        plugin_plugin_data = hop.plugin_data
         if plugin_plugin_data is not None:
-            if plugin_plugin_data.deprecation:
-                redirect_deprecations = (
-                    (plugin_fqcn, plugin_plugin_data.deprecation),
-                ) + (redirect_deprecations or ())
             new_plugin_data = PluginRouting(
                 action_plugin=plugin_plugin_data.action_plugin,
-                redirect=... if is_loop else next_name,
-                redirect_chain=redirect_chain,
-                redirect_deprecations=redirect_deprecations,
+                redirect=redirect,
+                redirect_chain=chain[index:],
+                redirect_deprecations=(
+                    tuple(deprecations[deprecation_starts[index] :]) or None
+                ),
                 redirect_tombstone=redirect_tombstone,
                 redirect_dead_end=redirect_dead_end,
                 redirect_error=redirect_error,
                 deprecation=plugin_plugin_data.deprecation,
                 tombstone=plugin_plugin_data.tombstone,
             )
-            if plugin_owner:
-                plugin_owner[plugin_plugin_name] = new_plugin_data
-            if plugin_fqcn == fqcn:
+            if hop.owner:
+                hop.owner[hop.plugin_name] = new_plugin_data
+            if hop.fqcn == fqcn:
                 plugin_data = new_plugin_data
     return plugin_data
 
 
-def complete_redirects_for_collection(
-    routing_data: Mapping[str, CollectionRouting], *, collection_name: str
+def _complete_redirects_for_collection(
+    routing_data: Mapping[str, CollectionRouting],
+    *,
+    collection_name: str,
+    collection_routing: CollectionRouting,
 ) -> None:
-    """
-    Complete all redirection data for the given collection.
-    """
-    rd = routing_data.get(collection_name)
-    if rd is None:
-        return
-    for plugin_type, plugin_routing_data in rd.plugin_data.items():
+    for plugin_type, plugin_routing_data in collection_routing.plugin_data.items():
         # Do *not* use .items() in the next loop, since the values could be
         # changed by earlier iterations:
         for plugin_name in list(plugin_routing_data):
@@ -525,12 +559,31 @@ def complete_redirects_for_collection(
             )
 
 
+def complete_redirects_for_collection(
+    routing_data: Mapping[str, CollectionRouting], *, collection_name: str
+) -> None:
+    """
+    Complete all redirection data for the given collection.
+    """
+    rd = routing_data.get(collection_name)
+    if rd is None:
+        return
+    _complete_redirects_for_collection(
+        routing_data, collection_name=collection_name, collection_routing=rd
+    )
+
+
 def complete_redirects(routing_data: Mapping[str, CollectionRouting]) -> None:
     """
     Complete all redirection data for all collections.
     """
-    for collection_name in routing_data:
-        complete_redirects_for_collection(routing_data, collection_name=collection_name)
+    # Every completed redirect is written back for all plugins along its chain,
+    # and later walks stop at the first completed plugin they reach. So every
+    # redirect is followed only once in total, whatever the processing order.
+    for collection_name, rd in routing_data.items():
+        _complete_redirects_for_collection(
+            routing_data, collection_name=collection_name, collection_routing=rd
+        )
 
 
 __all__ = (
@@ -13,9 +13,14 @@ Test ansible-galaxy code.
 
 from __future__ import annotations
 
+import functools
+import itertools
+import re
 import subprocess
+import typing as t
+from collections import deque
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from unittest import mock
 
 import pytest  # pylint: disable=import-error
 
@@ -27,11 +32,90 @@ from antsibull_docs_loader.ansible_cli import (
 )
 from antsibull_docs_loader.data import CollectionInfo
 
-LOCATE_ANSIBLE_BUILTIN_COLLECTION_DATA: list[
-    tuple[bytes, bytes, int, list[CollectionInfo]]
-] = [
-    (
-        b"""ansible [core 2.21.0.dev0] (devel 29086acfa6) last updated 2026/01/30 21:47:54 (GMT +200)
+
+class _Runner:
+    """
+    Runner that expects a specific command and returns a fixed result.
+    """
+
+    __slots__ = ("expected_args", "expects_env", "expected_env", "result")
+
+    def __init__(
+        self,
+        expected_args: list[str],
+        stdout: bytes,
+        stderr: bytes,
+        rc: int,
+        *,
+        expects_env: bool,
+        expected_env: dict[str, str] | None = None,
+    ) -> None:
+        self.expected_args = expected_args
+        self.expects_env = expects_env
+        self.expected_env = expected_env
+        self.result = (stdout, stderr, rc)
+
+    def __call__(
+        self, args: list[str], *, env: dict[str, str] | None = None
+    ) -> tuple[bytes, bytes, int]:
+        assert args == self.expected_args
+        assert (env is not None) == self.expects_env
+        if self.expected_env:
+            assert env is not None
+            for key, value in self.expected_env.items():
+                assert env[key] == value
+        return self.result
+
+
+class _SequenceRunner:
+    """
+    Runner that delegates the n-th call to the n-th runner.
+    """
+
+    __slots__ = ("runners", "calls")
+
+    def __init__(self, *runners: _Runner) -> None:
+        self.runners = runners
+        self.calls = 0
+
+    def __call__(
+        self, args: list[str], *, env: dict[str, str] | None = None
+    ) -> tuple[bytes, bytes, int]:
+        runner = self.runners[self.calls]
+        self.calls += 1
+        return runner(args, env=env)
+
+
+_DATA_DIR = Path(__file__).parent / "data"
+
+
+@functools.cache
+def _data_file(name: str) -> bytes:
+    return (_DATA_DIR / name).read_bytes()
+
+
+_SENTINEL = object()
+
+
+def assert_iter_equal(actual: Iterable[t.Any], expected: Sequence[t.Any]) -> None:
+    """
+    Compare an iterable element by element to a sequence, stopping at the first
+    difference.
+    """
+    for index, (actual_elt, expected_elt) in enumerate(
+        itertools.zip_longest(actual, expected, fillvalue=_SENTINEL)
+    ):
+        assert actual_elt is not _SENTINEL, f"Missing element #{index}"
+        assert expected_elt is not _SENTINEL, f"Unexpected element #{index}"
+        assert actual_elt == expected_elt
+
+
+_VERSION_ARGS = ["ansible-galaxy", "--version"]
+_LIST_ARGS = ["ansible-galaxy", "collection", "list"]
+_LIST_JSON_ARGS = ["ansible-galaxy", "collection", "list", "--format", "json"]
+_NO_FORMAT_JSON = (b"", b"XYZerror: unrecognized arguments: --formatABC", 2)
+
+ANSIBLE_CORE_VERSION_OUTPUT = b"""ansible [core 2.21.0.dev0] (devel 29086acfa6) last updated 2026/01/30 21:47:54 (GMT +200)
   config file = None
   configured module search path = ['/home/me/.ansible/plugins/modules', '/usr/share/ansible/plugins/modules']
   ansible python module location = /home/me/ansible/lib/ansible
@@ -40,7 +124,13 @@ LOCATE_ANSIBLE_BUILTIN_COLLECTION_DATA: list[
   python version = 3.14.2 (main, Jan  2 2026, 14:27:39) [GCC 15.2.1 20251112] (/usr/bin/python)
   jinja version = 3.1.6
   pyyaml version = 6.0.3 (with libyaml v0.2.5)
-""",
+"""
+
+LOCATE_ANSIBLE_BUILTIN_COLLECTION_DATA: list[
+    tuple[bytes, bytes, int, list[CollectionInfo]]
+] = [
+    (
+        ANSIBLE_CORE_VERSION_OUTPUT,
         b"",
         0,
         [
@@ -55,16 +145,9 @@ LOCATE_ANSIBLE_BUILTIN_COLLECTION_DATA: list[
         ],
     ),
     (
-        b"""ansible-galaxy [core 2.21.0.dev0] (devel 29086acfa6) last updated 2026/01/30 21:47:54 (GMT +200)
-  config file = None
-  configured module search path = ['/home/me/.ansible/plugins/modules', '/usr/share/ansible/plugins/modules']
-  ansible python module location = /home/me/ansible/lib/ansible
-  ansible collection location = /home/me/collections-root:/home/me/.ansible/collections:/usr/share/ansible/collections
-  executable location = /home/me/.local/bin/ansible
-  python version = 3.14.2 (main, Jan  2 2026, 14:27:39) [GCC 15.2.1 20251112] (/usr/bin/python)
-  jinja version = 3.1.6
-  pyyaml version = 6.0.3 (with libyaml v0.2.5)
-""",
+        ANSIBLE_CORE_VERSION_OUTPUT.replace(
+            b"ansible [core", b"ansible-galaxy [core", 1
+        ),
         b"",
         0,
         [
@@ -112,52 +195,102 @@ ansible python module location = foo
             ),
         ],
     ),
+    (
+        b"""ansible 1.2.3
+ansible python module location = foo
+foo ansible python module location = bar
+ansible [core 4.5.6]
+  ansible python module location = baz
+""",
+        b"",
+        0,
+        [
+            CollectionInfo(
+                path=Path("baz"),
+                namespace="ansible",
+                name="builtin",
+                full_name="ansible.builtin",
+                version="4.5.6",
+                is_ansible_core=True,
+            ),
+        ],
+    ),
 ]
 
 
-@pytest.mark.parametrize(
-    "stdout, stderr, rc, expected_collections",
-    LOCATE_ANSIBLE_BUILTIN_COLLECTION_DATA,
+@pytest.fixture(
+    name="locate_ansible_builtin_collection_case",
+    scope="module",
+    params=LOCATE_ANSIBLE_BUILTIN_COLLECTION_DATA,
+    ids=["ansible", "galaxy", "short", "playbook", "last-line-wins"],
 )
+def fixture_locate_ansible_builtin_collection_case(
+    request: pytest.FixtureRequest,
+) -> tuple[bytes, bytes, int, list[CollectionInfo]]:
+    return request.param
+
+
 def test_locate_ansible_builtin_collection(
-    stdout: bytes, stderr: bytes, rc: int, expected_collections: list[CollectionInfo]
+    locate_ansible_builtin_collection_case: tuple[
+        bytes, bytes, int, list[CollectionInfo]
+    ],
 ) -> None:
-    def runner(
-        args: list[str], *, env: dict[str, str] | None = None
-    ) -> tuple[bytes, bytes, int]:
-        assert args == ["ansible-galaxy", "--version"]
-        assert env is None
-        return stdout, stderr, rc
+    stdout, stderr, rc, expected_collections = locate_ansible_builtin_collection_case
+    runner = _Runner(_VERSION_ARGS, stdout, stderr, rc, expects_env=False)
+    assert_iter_equal(locate_ansible_builtin_collection(runner), expected_collections)
 
-    collection_list = list(locate_ansible_builtin_collection(runner))
-    assert collection_list == expected_collections
 
-
-LOCATE_ANSIBLE_BUILTIN_COLLECTION_FAIL_DATA: list[tuple[bytes, bytes, int, str]] = [
+LOCATE_ANSIBLE_BUILTIN_COLLECTION_FAIL_DATA: list[
+    tuple[bytes, bytes, int, re.Pattern[str]]
+] = [
     (
         b"Foo",
         b"",
         0,
-        r"^Cannot extract module location path from ansible --version output: Foo$",
+        re.compile(
+            r"^Cannot extract module location path from ansible --version output: Foo$"
+        ),
     ),
     (
         b"ansible python module location = foo",
         b"",
         0,
-        r"^Cannot extract ansible-core version from ansible --version output:"
-        r" ansible python module location = foo$",
+        re.compile(
+            r"^Cannot extract ansible-core version from ansible --version output:"
+            r" ansible python module location = foo$"
+        ),
     ),
     (
         b"ansible 1.2.3",
         b"",
         0,
-        r"^Cannot extract module location path from ansible --version output: ansible 1.2.3$",
+        re.compile(
+            r"^Cannot extract module location path from ansible --version output: ansible 1.2.3$"
+        ),
+    ),
+    (
+        b"ansible 1.2.3\nansible python module location\n",
+        b"",
+        0,
+        re.compile(
+            r"^Cannot extract module location path from ansible --version output: ansible 1.2.3\n"
+        ),
+    ),
+    (
+        b"ansible 1.2.3\nfoo ansible python module location = foo\n",
+        b"",
+        0,
+        re.compile(
+            r"^Cannot extract module location path from ansible --version output: ansible 1.2.3\n"
+        ),
     ),
     (
         b"",
         b"",
         1,
-        r"^Unexpected return code 1 when querying version. Standard error output: $",
+        re.compile(
+            r"^Unexpected return code 1 when querying version. Standard error output: $"
+        ),
     ),
 ]
 
@@ -165,17 +298,19 @@ LOCATE_ANSIBLE_BUILTIN_COLLECTION_FAIL_DATA: list[tuple[bytes, bytes, int, str]]
 @pytest.mark.parametrize(
     "stdout, stderr, rc, expected_error_matcher",
     LOCATE_ANSIBLE_BUILTIN_COLLECTION_FAIL_DATA,
+    ids=[
+        "no-location",
+        "no-version",
+        "version-only",
+        "location-without-value",
+        "location-not-at-line-start",
+        "rc-1",
+    ],
 )
 def test_locate_ansible_builtin_collection_fail(
-    stdout: bytes, stderr: bytes, rc: int, expected_error_matcher: str
+    stdout: bytes, stderr: bytes, rc: int, expected_error_matcher: re.Pattern[str]
 ) -> None:
-    def runner(
-        args: list[str], *, env: dict[str, str] | None = None
-    ) -> tuple[bytes, bytes, int]:
-        assert args == ["ansible-galaxy", "--version"]
-        assert env is None
-        return stdout, stderr, rc
-
+    runner = _Runner(_VERSION_ARGS, stdout, stderr, rc, expects_env=False)
     with pytest.raises(ListingCollectionsError, match=expected_error_matcher):
         list(locate_ansible_builtin_collection(runner))
 
@@ -205,15 +340,7 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_DATA: list[
         "foo-bar",
         False,
         True,
-        b"""{
-"/foo": {
-    "bar": {},
-    "baz.bam": {},
-    "foo.bar": {"version": "*"},
-    "foo.bam": {"version": "1.2.3"},
-    "baz.bar": {"version": 42}
-}
-        }""",
+        _data_file("galaxy_list_json.bin"),
         b"",
         0,
         [
@@ -254,6 +381,7 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_DATA: list[
     "collections_path, only_pass_env_updates, expects_env,"
     " stdout, stderr, rc, expected_collections",
     ANSIBLE_GALAXY_LIST_COLLECTIONS_DATA,
+    ids=["no-usable-paths", "empty", "collections"],
 )
 def test_ansible_galaxy_list_collections(
     collections_path: str | None,
@@ -264,25 +392,46 @@ def test_ansible_galaxy_list_collections(
     rc: int,
     expected_collections: list[CollectionInfo],
 ) -> None:
+    runner = _Runner(_LIST_JSON_ARGS, stdout, stderr, rc, expects_env=expects_env)
+    assert_iter_equal(
+        ansible_galaxy_list_collections(
+            runner,
+            collections_path=collections_path,
+            only_pass_env_updates=only_pass_env_updates,
+        ),
+        expected_collections,
+    )
+
+
+def test_ansible_galaxy_list_collections_minimal_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("PATH", "/usr/bin")
+    monkeypatch.setenv("ANSIBLE_CONFIG", "/foo/ansible.cfg")
+    monkeypatch.setenv("SOMETHING_ELSE", "foo")
+
     def runner(
         args: list[str], *, env: dict[str, str] | None = None
     ) -> tuple[bytes, bytes, int]:
         assert args == ["ansible-galaxy", "collection", "list", "--format", "json"]
-        assert (env is not None) == expects_env
-        return stdout, stderr, rc
+        assert env is not None
+        assert env["PATH"] == "/usr/bin"
+        assert env["ANSIBLE_CONFIG"] == "/foo/ansible.cfg"
+        assert env["ANSIBLE_COLLECTIONS_PATH"] == "foo-bar"
+        assert env["ANSIBLE_LIBRARY"] == "/dev/null"
+        assert "SOMETHING_ELSE" not in env
+        return b"{}", b"", 0
 
     collections = list(
         ansible_galaxy_list_collections(
-            runner,
-            collections_path=collections_path,
-            only_pass_env_updates=only_pass_env_updates,
+            runner, collections_path="foo-bar", minimal_env=True
         )
     )
-    assert collections == expected_collections
+    assert not collections
 
 
 ANSIBLE_GALAXY_LIST_COLLECTIONS_FAIL_DATA: list[
-    tuple[str | None, bool, bool, bytes, bytes, int, str]
+    tuple[str | None, bool, bool, bytes, bytes, int, re.Pattern[str]]
 ] = [
     (
         None,
@@ -291,8 +440,10 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_FAIL_DATA: list[
         b"",
         b"BlablaNone of the provided paths were usable.Blabla",
         2,
-        r"^Unexpected return code 2 when listing collections\. Standard error output:"
-        r" BlablaNone of the provided paths were usable\.Blabla$",
+        re.compile(
+            r"^Unexpected return code 2 when listing collections\. Standard error output:"
+            r" BlablaNone of the provided paths were usable\.Blabla$"
+        ),
     ),
     (
         "foo-bar",
@@ -301,7 +452,9 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_FAIL_DATA: list[
         b"{}",
         b"",
         5,
-        r"^Unexpected return code 5 when listing collections\. Standard error output: $",
+        re.compile(
+            r"^Unexpected return code 5 when listing collections\. Standard error output: $"
+        ),
     ),
     (
         None,
@@ -310,9 +463,23 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_FAIL_DATA: list[
         b"""{"/foo": {"bar": {},}}""",
         b"",
         0,
-        r"^Error while loading collection list: (Illegal trailing comma"
-        r" before end of object: line 1 column 20 \(char 19\)|Expecting property"
-        r" name enclosed in double quotes: line 1 column 21 \(char 20\))$",
+        re.compile(
+            r"^Error while loading collection list: (Illegal trailing comma"
+            r" before end of object: line 1 column 20 \(char 19\)|Expecting property"
+            r" name enclosed in double quotes: line 1 column 21 \(char 20\))$"
+        ),
+    ),
+    (
+        None,
+        True,
+        True,
+        b"[1, 2]",
+        b"",
+        0,
+        re.compile(
+            r"^Error while loading collection list:"
+            r" 'list' object has no attribute 'items'$"
+        ),
     ),
     (
         None,
@@ -321,7 +488,7 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_FAIL_DATA: list[
         b"""""",
         b"ABCerror: argument COLLECTION_ACTION: invalid choice: 'list'XYZ",
         2,
-        r"^ansible-galaxy does not support 'collection list' command$",
+        re.compile(r"^ansible-galaxy does not support 'collection list' command$"),
     ),
 ]
 
@@ -330,6 +497,7 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_FAIL_DATA: list[
     "collections_path, only_pass_env_updates, expects_env,"
     " stdout, stderr, rc, expected_error_matcher",
     ANSIBLE_GALAXY_LIST_COLLECTIONS_FAIL_DATA,
+    ids=["rc-2", "rc-5", "invalid-json", "json-not-an-object", "ansible-2.9"],
 )
 def test_ansible_galaxy_list_collections_fail(
     collections_path: str | None,
@@ -338,24 +506,17 @@ def test_ansible_galaxy_list_collections_fail(
     stdout: bytes,
     stderr: bytes,
     rc: int,
-    expected_error_matcher: str,
+    expected_error_matcher: re.Pattern[str],
 ) -> None:
-    def runner(
-        args: list[str], *, env: dict[str, str] | None = None
-    ) -> tuple[bytes, bytes, int]:
-        assert args == ["ansible-galaxy", "collection", "list", "--format", "json"]
-        assert (env is not None) == expects_env
-        return stdout, stderr, rc
-
+    runner = _Runner(_LIST_JSON_ARGS, stdout, stderr, rc, expects_env=expects_env)
     with pytest.raises(ListingCollectionsError, match=expected_error_matcher):
-        print(
-            list(
-                ansible_galaxy_list_collections(
-                    runner,
-                    collections_path=collections_path,
-                    only_pass_env_updates=only_pass_env_updates,
-                )
-            )
+        deque(
+            ansible_galaxy_list_collections(
+                runner,
+                collections_path=collections_path,
+                only_pass_env_updates=only_pass_env_updates,
+            ),
+            maxlen=0,
         )
 
 
@@ -384,16 +545,7 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_COMPAT_DATA: list[
         "foo-bar",
         False,
         True,
-        b"""{
-# /foo
-Collection                               Version    
----------------------------------------- -----------
-bar                                      *      
-baz.bam                                  *      
-foo.bar                                  *      
-foo.bam                                  1.2.3      
-baz.bar                                  *      
-        """,
+        _data_file("galaxy_list_text.bin"),
         b"",
         0,
         [
@@ -452,6 +604,7 @@ baz.bar                                  *
     "collections_path, only_pass_env_updates, expects_env,"
     " stdout, stderr, rc, expected_collections",
     ANSIBLE_GALAXY_LIST_COLLECTIONS_COMPAT_DATA,
+    ids=["no-usable-paths", "empty", "collections", "no-root"],
 )
 def test_ansible_galaxy_list_collections_compat(
     collections_path: str | None,
@@ -462,33 +615,39 @@ def test_ansible_galaxy_list_collections_compat(
     rc: int,
     expected_collections: list[CollectionInfo],
 ) -> None:
-    counter = [0]
-
-    def runner(
-        args: list[str], *, env: dict[str, str] | None = None
-    ) -> tuple[bytes, bytes, int]:
-        counter[0] += 1
-        if counter[0] == 1:
-            assert args == ["ansible-galaxy", "collection", "list", "--format", "json"]
-            assert (env is not None) == expects_env
-            return b"", b"XYZerror: unrecognized arguments: --formatABC", 2
-        assert args == ["ansible-galaxy", "collection", "list"]
-        assert (env is not None) == expects_env
-        return stdout, stderr, rc
+    compat_runner = _Runner(
+        _LIST_ARGS,
+        stdout,
+        stderr,
+        rc,
+        expects_env=expects_env,
+        expected_env=(
+            {
+                "ANSIBLE_COLLECTIONS_PATH": collections_path,
+                "ANSIBLE_COLLECTIONS_PATHS": collections_path,
+            }
+            if collections_path
+            else None
+        ),
+    )
+    runner = _SequenceRunner(
+        _Runner(_LIST_JSON_ARGS, *_NO_FORMAT_JSON, expects_env=expects_env),
+        compat_runner,
+    )
 
-    collections = list(
+    assert_iter_equal(
         ansible_galaxy_list_collections(
             runner,
             collections_path=collections_path,
             only_pass_env_updates=only_pass_env_updates,
-        )
+        ),
+        expected_collections,
     )
-    assert collections == expected_collections
-    assert counter[0] == 2
+    assert runner.calls == 2
 
 
 ANSIBLE_GALAXY_LIST_COLLECTIONS_COMPAT_FAIL_DATA: list[
-    tuple[str | None, bool, bool, bytes, bytes, int, str]
+    tuple[str | None, bool, bool, bytes, bytes, int, re.Pattern[str]]
 ] = [
     (
         None,
@@ -497,8 +656,10 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_COMPAT_FAIL_DATA: list[
         b"",
         b"BlablaNone of the provided paths were usable.Blabla",
         2,
-        r"^Unexpected return code 2 when listing collections\."
-        r" Standard error output: BlablaNone of the provided paths were usable\.Blabla$",
+        re.compile(
+            r"^Unexpected return code 2 when listing collections\."
+            r" Standard error output: BlablaNone of the provided paths were usable\.Blabla$"
+        ),
     ),
 ]
 
@@ -507,6 +668,7 @@ ANSIBLE_GALAXY_LIST_COLLECTIONS_COMPAT_FAIL_DATA: list[
     "collections_path, only_pass_env_updates, expects_env,"
     " stdout, stderr, rc, expected_error_matcher",
     ANSIBLE_GALAXY_LIST_COLLECTIONS_COMPAT_FAIL_DATA,
+    ids=["rc-2"],
 )
 def test_ansible_galaxy_list_collections_compat_fail(
     collections_path: str | None,
@@ -515,44 +677,36 @@ def test_ansible_galaxy_list_collections_compat_fail(
     stdout: bytes,
     stderr: bytes,
     rc: int,
-    expected_error_matcher: str,
+    expected_error_matcher: re.Pattern[str],
 ) -> None:
-    counter = [0]
-
-    def runner(
-        args: list[str], *, env: dict[str, str] | None = None
-    ) -> tuple[bytes, bytes, int]:
-        counter[0] += 1
-        if counter[0] == 1:
-            assert args == ["ansible-galaxy", "collection", "list", "--format", "json"]
-            assert (env is not None) == expects_env
-            return b"", b"XYZerror: unrecognized arguments: --formatABC", 2
-        assert args == ["ansible-galaxy", "collection", "list"]
-        assert (env is not None) == expects_env
-        return stdout, stderr, rc
+    runner = _SequenceRunner(
+        _Runner(_LIST_JSON_ARGS, *_NO_FORMAT_JSON, expects_env=expects_env),
+        _Runner(_LIST_ARGS, stdout, stderr, rc, expects_env=expects_env),
+    )
 
     with pytest.raises(ListingCollectionsError, match=expected_error_matcher):
-        print(
-            list(
-                ansible_galaxy_list_collections(
-                    runner,
-                    collections_path=collections_path,
-                    only_pass_env_updates=only_pass_env_updates,
-                )
-            )
+        deque(
+            ansible_galaxy_list_collections(
+                runner,
+                collections_path=collections_path,
+                only_pass_env_updates=only_pass_env_updates,
+            ),
+            maxlen=0,
         )
-    assert counter[0] == 2
+    assert runner.calls == 2
 
 
-def test_simple_runner() -> None:
-    with mock.patch(
-        "subprocess.run",
-        return_value=subprocess.CompletedProcess(
-            args=["foo", "bar"], returncode=23, stdout=b"stdout", stderr=b"stderr"
-        ),
-    ) as m:
-        assert simple_runner(["foo", "bar"]) == (b"stdout", b"stderr", 23)
+def test_simple_runner(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[list[str], dict[str, t.Any]]] = []
 
-    m.assert_called_once_with(
-        ["foo", "bar"], env=None, capture_output=True, check=False
-    )
+    def run(args: list[str], **kwargs: t.Any) -> subprocess.CompletedProcess:
+        calls.append((args, kwargs))
+        return subprocess.CompletedProcess(
+            args=args, returncode=23, stdout=b"stdout", stderr=b"stderr"
+        )
+
+    monkeypatch.setattr(subprocess, "run", run)
+    assert simple_runner(["foo", "bar"]) == (b"stdout", b"stderr", 23)
+    assert calls == [
+        (["foo", "bar"], {"env": None, "capture_output": True, "check": False})
+    ]
@@ -19,96 +19,134 @@ from antsibull_docs_loader.data import (
     CollectionInfos,
 )
 
+CORE_1 = CollectionInfo(
+    path=Path("/core-1"),
+    namespace="ansible",
+    name="builtin",
+    full_name="ansible.builtin",
+    version="1.2.3",
+    is_ansible_core=True,
+)
+CORE_1_NOT_REAL = CollectionInfo(
+    path=Path("/core-1"),
+    namespace="ansible",
+    name="builtin",
+    full_name="ansible.builtin",
+    version="1.2.3",
+    is_ansible_core=False,
+)
+CORE_2 = CollectionInfo(
+    path=Path("/core-2"),
+    namespace="ansible",
+    name="builtin",
+    full_name="ansible.builtin",
+    version="3.2.1",
+    is_ansible_core=True,
+)
+CORE_2_NOT_REAL = CollectionInfo(
+    path=Path("/core-2"),
+    namespace="ansible",
+    name="builtin",
+    full_name="ansible.builtin",
+    version="3.2.1",
+    is_ansible_core=False,
+)
+FAKE_CORE = CollectionInfo(
+    path=Path("/fake-core"),
+    namespace="foo",
+    name="bar",
+    full_name="foo.bar",
+    version="3.2.1",
+    is_ansible_core=True,
+)
+COLL_1 = CollectionInfo(
+    path=Path("/coll-1"),
+    namespace="foo",
+    name="bar",
+    full_name="foo.bar",
+    version="1.2.3",
+    is_ansible_core=False,
+)
+COLL_2 = CollectionInfo(
+    path=Path("/coll-1"),
+    namespace="foo",
+    name="bar",
+    full_name="foo.bar",
+    version="3.2.1",
+    is_ansible_core=False,
+)
+
+
+COLLECTION_INFOS_BUILD_DATA: list[
+    tuple[list[CollectionInfo], CollectionInfo | None, dict[str, CollectionInfo]]
+] = [
+    ([], None, {}),
+    ([CORE_1_NOT_REAL, CORE_2], CORE_2, {"ansible.builtin": CORE_2}),
+    ([CORE_1, CORE_2_NOT_REAL], CORE_1, {"ansible.builtin": CORE_1}),
+    ([COLL_1, COLL_2], None, {"foo.bar": COLL_1}),
+    ([COLL_2, COLL_1], None, {"foo.bar": COLL_2}),
+    (
+        [COLL_1, CORE_1, COLL_2],
+        CORE_1,
+        {"ansible.builtin": CORE_1, "foo.bar": COLL_1},
+    ),
+]
 
-def test_CollectionInfos_build() -> None:
-    ci = CollectionInfos.build([])
-    assert ci.ansible_core is None
-    assert (
-        ci.collections == {}  # pylint: disable=use-implicit-booleaness-not-comparison
-    )
-
-    core_1 = CollectionInfo(
-        path=Path("/core-1"),
-        namespace="ansible",
-        name="builtin",
-        full_name="ansible.builtin",
-        version="1.2.3",
-        is_ansible_core=True,
-    )
-    core_1_not_real = CollectionInfo(
-        path=Path("/core-1"),
-        namespace="ansible",
-        name="builtin",
-        full_name="ansible.builtin",
-        version="1.2.3",
-        is_ansible_core=False,
-    )
-    core_2 = CollectionInfo(
-        path=Path("/core-2"),
-        namespace="ansible",
-        name="builtin",
-        full_name="ansible.builtin",
-        version="3.2.1",
-        is_ansible_core=True,
-    )
-    core_2_not_real = CollectionInfo(
-        path=Path("/core-2"),
-        namespace="ansible",
-        name="builtin",
-        full_name="ansible.builtin",
-        version="3.2.1",
-        is_ansible_core=False,
-    )
-    fake_core = CollectionInfo(
-        path=Path("/fake-core"),
-        namespace="foo",
-        name="bar",
-        full_name="foo.bar",
-        version="3.2.1",
-        is_ansible_core=True,
-    )
-
-    with pytest.raises(
-        ValueError,
-        match=r"^Found more than one collection claiming to be ansible-core$",
-    ):
-        CollectionInfos.build([core_1, core_2])
-
-    with pytest.raises(
-        ValueError,
-        match=r"^Ansible-core has wrong full name 'foo\.bar'$",
-    ):
-        CollectionInfos.build([fake_core])
-
-    ci = CollectionInfos.build([core_1_not_real, core_2])
-    assert ci.ansible_core is core_2
-    assert ci.collections == {"ansible.builtin": core_2}
-
-    ci = CollectionInfos.build([core_1, core_2_not_real])
-    assert ci.ansible_core is core_1
-    assert ci.collections == {"ansible.builtin": core_1}
-
-    coll_1 = CollectionInfo(
-        path=Path("/coll-1"),
-        namespace="foo",
-        name="bar",
-        full_name="foo.bar",
-        version="1.2.3",
-        is_ansible_core=False,
-    )
-    coll_2 = CollectionInfo(
-        path=Path("/coll-1"),
-        namespace="foo",
-        name="bar",
-        full_name="foo.bar",
-        version="3.2.1",
-        is_ansible_core=False,
-    )
-
-    ci = CollectionInfos.build([coll_1, coll_2])
-    assert ci.ansible_core is None
-    assert ci.collections == {"foo.bar": coll_1}
-
-    ci = CollectionInfos.build([coll_2, coll_1])
-    assert ci.ansible_core is None
-    assert ci.collections == {"foo.bar": coll_2}
+
+@pytest.mark.parametrize(
+    "collections, expected_ansible_core, expected_collections",
+    COLLECTION_INFOS_BUILD_DATA,
+    ids=[
+        "empty",
+        "core-2",
+        "core-1",
+        "first-collection",
+        "first-collection-reversed",
+        "mixed",
+    ],
+)
+def test_CollectionInfos_build(
+    collections: list[CollectionInfo],
+    expected_ansible_core: CollectionInfo | None,
+    expected_collections: dict[str, CollectionInfo],
+) -> None:
+    ci = CollectionInfos.build(collections)
+    assert ci.ansible_core is expected_ansible_core
+    assert ci.collections == expected_collections
+    # Dictionary comparison ignores order
+    assert list(ci.collections) == list(expected_collections)
+
+
+def test_CollectionInfos_build_iterator() -> None:
+    ci = CollectionInfos.build(coll for coll in [COLL_1, CORE_1, COLL_2])
+    assert ci.ansible_core is CORE_1
+    assert ci.collections == {"ansible.builtin": CORE_1, "foo.bar": COLL_1}
+    assert list(ci.collections) == ["ansible.builtin", "foo.bar"]
+
+
+COLLECTION_INFOS_BUILD_FAIL_DATA: list[tuple[list[CollectionInfo], str]] = [
+    (
+        [CORE_1, CORE_2],
+        r"^Found more than one collection claiming to be ansible-core$",
+    ),
+    (
+        [FAKE_CORE],
+        r"^Ansible-core has wrong full name 'foo\.bar'$",
+    ),
+    (
+        [FAKE_CORE, COLL_1, CORE_1],
+        r"^Found more than one collection claiming to be ansible-core$",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "collections, expected_error_matcher",
+    COLLECTION_INFOS_BUILD_FAIL_DATA,
+    ids=["two-cores", "wrong-name", "wrong-name-and-two-cores"],
+)
+def test_CollectionInfos_build_fail(
+    collections: list[CollectionInfo], expected_error_matcher: str
+) -> None:
+    with pytest.raises(ValueError, match=expected_error_matcher):
+        CollectionInfos.build(collections)
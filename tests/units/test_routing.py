@@ -13,13 +13,20 @@ Test routing code.
 
 from __future__ import annotations
 
-import copy
+import dataclasses
 import datetime
+import functools
+import os
+import re
+import types
+import typing as t
 from collections.abc import Mapping
 from pathlib import Path
 
 import pytest  # pylint: disable=import-error
 
+from antsibull_docs_loader import _yaml
+from antsibull_docs_loader.ansible import PluginType
 from antsibull_docs_loader.data import CollectionInfo, CollectionInfos
 from antsibull_docs_loader.routing import (
     CollectionRouting,
@@ -31,49 +38,39 @@ from antsibull_docs_loader.routing import (
     load_routing_information,
 )
 
+_EMPTY_REMOVAL_DATA = RemovalData(
+    warning_text=None,
+    removal_version=None,
+    removal_date=None,
+)
 
-def test_load_routing_information_core(tmp_path: Path) -> None:
-    core = CollectionInfo(
-        path=tmp_path,
-        namespace="ansible",
-        name="builtin",
-        full_name="ansible.builtin",
-        version="2.20.1",
-        is_ansible_core=True,
-    )
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    metadata = config_dir / "ansible_builtin_runtime.yml"
+_EMPTY_PLUGIN_ROUTING = PluginRouting(
+    action_plugin=None,
+    redirect=None,
+    redirect_chain=None,
+    redirect_deprecations=None,
+    redirect_tombstone=False,
+    redirect_dead_end=False,
+    redirect_error=None,
+    deprecation=None,
+    tombstone=None,
+)
 
-    routing_info = load_routing_information(core)
-    assert routing_info.plugin_data == {}
 
-    metadata.write_text("---")
-    routing_info = load_routing_information(core)
-    assert routing_info.plugin_data == {}
+def _plugin_routing(**kwargs: t.Any) -> PluginRouting:
+    return dataclasses.replace(_EMPTY_PLUGIN_ROUTING, **kwargs)
 
-    metadata.write_text("""---
-plugin_routing:
-""")
-    routing_info = load_routing_information(core)
-    assert routing_info.plugin_data == {}
 
-    metadata.write_text("""---
-plugin_routing:
-  connection:
-""")
-    routing_info = load_routing_information(core)
-    assert routing_info.plugin_data == {}
+# Hand out one instance per text, so that the input data and the expected
+# results share their RemovalData objects
+@functools.cache
+def _removal_data(warning_text: str) -> RemovalData:
+    return RemovalData(
+        warning_text=warning_text, removal_version=None, removal_date=None
+    )
 
-    metadata.write_text("""---
-plugin_routing:
-  nothing-we-care-about:
-    foo:
-""")
-    routing_info = load_routing_information(core)
-    assert routing_info.plugin_data == {}
 
-    metadata.write_text("""---
+CORE_ROUTING_YAML = """---
 plugin_routing:
   connection:
     redirected_local:
@@ -143,277 +140,83 @@ import_redirection:
     redirect: ansible_collections.testns.testcoll.plugins.module_utils.base
   ansible.module_utils.known_hosts:
     redirect: ansible_collections.community.general.plugins.module_utils.known_hosts
-""")
-    routing_info = load_routing_information(core)
+"""
 
-    assert sorted(routing_info.plugin_data) == [
-        "action",
-        "connection",
-        "filter",
-        "inventory",
-        "lookup",
-        "module",
-        "module_utils",
-        "netconf",
-        "shell",
-        "test",
-    ]
-    assert routing_info.plugin_data["connection"] == {
-        "redirected_local": PluginRouting(
-            action_plugin=None,
+CORE_ROUTING_PLUGIN_DATA: dict[str, dict[str, PluginRouting]] = {
+    "connection": {
+        "redirected_local": _plugin_routing(
             redirect="ansible.builtin.local",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
             deprecation=RemovalData(
                 warning_text="foo",
                 removal_version="1.2.3",
                 removal_date=datetime.date(2030, 1, 1),
             ),
-            tombstone=None,
         ),
-    }
-    assert routing_info.plugin_data["module"] == {
-        "formerly_core_ping": PluginRouting(
-            action_plugin=None,
+    },
+    "module": {
+        "formerly_core_ping": _plugin_routing(
             redirect="testns.testcoll.ping",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
             tombstone=RemovalData(
                 warning_text="foo",
                 removal_version="1.2.3",
                 removal_date="2030-01-01",
             ),
         ),
-        "uses_redirected_action": PluginRouting(
-            action_plugin=None,
-            redirect="ansible.builtin.ping",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-        "foo": PluginRouting(
-            action_plugin=None,
-            redirect=None,
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-        "bar": PluginRouting(
-            action_plugin=None,
-            redirect=None,
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-        "meh": PluginRouting(
-            action_plugin="foo",
-            redirect=None,
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-    }
-    assert routing_info.plugin_data["module_utils"] == {
-        "formerly_core": PluginRouting(
-            action_plugin=None,
+        "uses_redirected_action": _plugin_routing(redirect="ansible.builtin.ping"),
+        "foo": _EMPTY_PLUGIN_ROUTING,
+        "bar": _EMPTY_PLUGIN_ROUTING,
+        "meh": _plugin_routing(action_plugin="foo"),
+    },
+    "module_utils": {
+        "formerly_core": _plugin_routing(
             redirect="ansible_collections.testns.testcoll.plugins.module_utils.base",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=RemovalData(
-                warning_text=None,
-                removal_version=None,
-                removal_date=None,
-            ),
-            tombstone=None,
+            deprecation=_EMPTY_REMOVAL_DATA,
         ),
-        "sub1.sub2.formerly_core": PluginRouting(
-            action_plugin=None,
+        "sub1.sub2.formerly_core": _plugin_routing(
             redirect="ansible_collections.testns.testcoll.plugins.module_utils.base",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=RemovalData(
-                warning_text=None,
-                removal_version=None,
-                removal_date=None,
-            ),
+            tombstone=_EMPTY_REMOVAL_DATA,
         ),
-    }
-    assert routing_info.plugin_data["action"] == {
-        "uses_redirected_action": PluginRouting(
-            action_plugin=None,
-            redirect="testns.testcoll.subclassed_norm",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=RemovalData(
-                warning_text=None,
-                removal_version=None,
-                removal_date=None,
-            ),
+    },
+    "action": {
+        "uses_redirected_action": _plugin_routing(
+            redirect="testns.testcoll.subclassed_norm", tombstone=_EMPTY_REMOVAL_DATA
         ),
-    }
-    assert routing_info.plugin_data["filter"] == {
-        "formerly_core_filter": PluginRouting(
-            action_plugin=None,
+    },
+    "filter": {
+        "formerly_core_filter": _plugin_routing(
             redirect="ansible.builtin.bool",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
             deprecation=RemovalData(
                 warning_text="foo",
                 removal_version="1.2.3",
                 removal_date=datetime.date(2030, 1, 1),
             ),
-            tombstone=None,
-        ),
-        "formerly_core_masked_filter": PluginRouting(
-            action_plugin=None,
-            redirect="ansible.builtin.bool",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-    }
-    assert routing_info.plugin_data["inventory"] == {
-        "formerly_core_inventory": PluginRouting(
-            action_plugin=None,
-            redirect="testns.content_adj.statichost",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-    }
-    assert routing_info.plugin_data["lookup"] == {
-        "formerly_core_lookup": PluginRouting(
-            action_plugin=None,
-            redirect="testns.testcoll.mylookup",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-    }
-    assert routing_info.plugin_data["shell"] == {
-        "formerly_core_powershell": PluginRouting(
-            action_plugin=None,
-            redirect="ansible.builtin.powershell",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-    }
-    assert routing_info.plugin_data["test"] == {
-        "formerly_core_test": PluginRouting(
-            action_plugin=None,
-            redirect="ansible.builtin.search",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
         ),
-        "formerly_core_masked_test": PluginRouting(
-            action_plugin=None,
-            redirect="ansible.builtin.search",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
+        "formerly_core_masked_filter": _plugin_routing(redirect="ansible.builtin.bool"),
+    },
+    "inventory": {
+        "formerly_core_inventory": _plugin_routing(
+            redirect="testns.content_adj.statichost"
         ),
-    }
-    assert routing_info.plugin_data["test"] == {
-        "formerly_core_test": PluginRouting(
-            action_plugin=None,
-            redirect="ansible.builtin.search",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-        "formerly_core_masked_test": PluginRouting(
-            action_plugin=None,
-            redirect="ansible.builtin.search",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
+    },
+    "lookup": {
+        "formerly_core_lookup": _plugin_routing(redirect="testns.testcoll.mylookup"),
+    },
+    "shell": {
+        "formerly_core_powershell": _plugin_routing(
+            redirect="ansible.builtin.powershell"
         ),
-    }
-    assert routing_info.plugin_data["netconf"] == {
-        "loop": PluginRouting(
-            action_plugin=None,
+    },
+    "test": {
+        "formerly_core_test": _plugin_routing(redirect="ansible.builtin.search"),
+        "formerly_core_masked_test": _plugin_routing(redirect="ansible.builtin.search"),
+    },
+    "netconf": {
+        "loop": _plugin_routing(
             redirect=...,
             redirect_chain=("ansible.builtin.loop", "ansible.builtin.loop"),
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
             redirect_error="Detected circular redirect",
-            deprecation=None,
-            tombstone=None,
         ),
-        "loop_w_depr": PluginRouting(
-            action_plugin=None,
+        "loop_w_depr": _plugin_routing(
             redirect=...,
             redirect_chain=(
                 "ansible.builtin.loop_w_depr",
@@ -422,39 +225,105 @@ import_redirection:
             redirect_deprecations=(
                 (
                     "ansible.builtin.loop_w_depr",
-                    RemovalData(
-                        warning_text=None,
-                        removal_version=None,
-                        removal_date=None,
-                    ),
+                    _EMPTY_REMOVAL_DATA,
                 ),
             ),
-            redirect_tombstone=False,
-            redirect_dead_end=False,
             redirect_error="Detected circular redirect",
-            deprecation=RemovalData(
-                warning_text=None,
-                removal_version=None,
-                removal_date=None,
-            ),
-            tombstone=None,
+            deprecation=_EMPTY_REMOVAL_DATA,
         ),
+    },
+}
+
+
+LOAD_EMPTY_ROUTING_CASES: list[str | None] = [
+    None,
+    "---",
+    """---
+plugin_routing:
+""",
+    """---
+plugin_routing:
+  connection:
+""",
+    """---
+plugin_routing:
+  nothing-we-care-about:
+    foo:
+""",
+]
+
+
+def _create_core_info(path: Path) -> CollectionInfo:
+    (path / "config").mkdir()
+    return CollectionInfo(
+        path=path,
+        namespace="ansible",
+        name="builtin",
+        full_name="ansible.builtin",
+        version="2.20.1",
+        is_ansible_core=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "content",
+    LOAD_EMPTY_ROUTING_CASES,
+    ids=["missing", "empty", "no-types", "no-plugins", "unknown-type"],
+)
+def test_load_routing_information_core_empty(
+    content: str | None, tmp_path: Path
+) -> None:
+    core = _create_core_info(tmp_path)
+    if content is not None:
+        (tmp_path / "config" / "ansible_builtin_runtime.yml").write_text(content)
+    routing_info = load_routing_information(core)
+    assert routing_info.plugin_data == {}
+
+
+def test_load_routing_information_core(tmp_path: Path) -> None:
+    core = _create_core_info(tmp_path)
+    metadata = tmp_path / "config" / "ansible_builtin_runtime.yml"
+    metadata.write_text(CORE_ROUTING_YAML)
+    routing_info = load_routing_information(core)
+
+    assert routing_info.plugin_data.keys() == {
+        "action",
+        "connection",
+        "filter",
+        "inventory",
+        "lookup",
+        "module",
+        "module_utils",
+        "netconf",
+        "shell",
+        "test",
     }
+    assert routing_info.plugin_data == CORE_ROUTING_PLUGIN_DATA
+    # Identical removal data is shared
+    module_utils = routing_info.plugin_data["module_utils"]
+    assert (
+        module_utils["formerly_core"].deprecation
+        is module_utils["sub1.sub2.formerly_core"].tombstone
+    )
 
 
-LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
+LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, re.Pattern[str]]] = [
     (
         """---
         "plugin_routing"
         """,
-        r"^Runtime information in .* must have a top-level mapping, got <class 'str'>$",
+        re.compile(
+            r"^Runtime information in .* must have a top-level mapping, got <class 'str'>$"
+        ),
     ),
     (
         """---
         plugin_routing:
           - foo
         """,
-        r"^Plugin routing information in .* must be a mapping, got <class 'list'>$",
+        re.compile(
+            r"^Plugin routing information in .* must be a mapping, got <class 'list'>$"
+        ),
     ),
     (
         """---
@@ -462,8 +331,10 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
           connection:
             - foo
         """,
-        r"^Plugin routing information in .* for type connection must be a mapping,"
-        r" got <class 'list'>$",
+        re.compile(
+            r"^Plugin routing information in .* for type connection must be a mapping,"
+            r" got <class 'list'>$"
+        ),
     ),
     (
         """---
@@ -471,7 +342,9 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
           modules:
             foo: 123
         """,
-        r"^Routing information for modules foo in .* must be a mapping, got <class 'int'>$",
+        re.compile(
+            r"^Routing information for modules foo in .* must be a mapping, got <class 'int'>$"
+        ),
     ),
     (
         """---
@@ -480,7 +353,9 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
             foo:
               action_plugin: true
         """,
-        r"^action_plugin for modules foo in .* must be a string, got <class 'bool'>$",
+        re.compile(
+            r"^action_plugin for modules foo in .* must be a string, got <class 'bool'>$"
+        ),
     ),
     (
         """---
@@ -489,7 +364,9 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
             foo:
               redirect: 123
         """,
-        r"^redirect for connection foo in .* must be a string, got <class 'int'>$",
+        re.compile(
+            r"^redirect for connection foo in .* must be a string, got <class 'int'>$"
+        ),
     ),
     (
         """---
@@ -498,7 +375,9 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
             foo:
               deprecation:
         """,
-        r"^Deprecation for connection foo in .* must be a mapping, got <class 'NoneType'>$",
+        re.compile(
+            r"^Deprecation for connection foo in .* must be a mapping, got <class 'NoneType'>$"
+        ),
     ),
     (
         """---
@@ -508,8 +387,10 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
               deprecation:
                 warning_text: 123
         """,
-        r"^Deprecation for connection foo in .* must have its warning_text a string,"
-        r" got <class 'int'>$",
+        re.compile(
+            r"^Deprecation for connection foo in .* must have its warning_text a string,"
+            r" got <class 'int'>$"
+        ),
     ),
     (
         """---
@@ -519,8 +400,10 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
               deprecation:
                 removal_version: true
         """,
-        r"^Deprecation for connection foo in .* must have its removal_version a string,"
-        r" got <class 'bool'>$",
+        re.compile(
+            r"^Deprecation for connection foo in .* must have its removal_version a string,"
+            r" got <class 'bool'>$"
+        ),
     ),
     (
         """---
@@ -530,8 +413,10 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
               deprecation:
                 removal_date: 1.2
         """,
-        r"^Deprecation for connection foo in .* must have its removal_date a string or date,"
-        r" got <class 'float'>$",
+        re.compile(
+            r"^Deprecation for connection foo in .* must have its removal_date a string or date,"
+            r" got <class 'float'>$"
+        ),
     ),
 ]
 
@@ -541,20 +426,10 @@ LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA: list[tuple[str, str]] = [
     LOAD_ROUTING_INFORMATION_CORE_FAIL_DATA,
 )
 def test_load_routing_information_core_fail(
-    runtime_content: str, expected_error: str, tmp_path: Path
+    runtime_content: str, expected_error: re.Pattern[str], tmp_path: Path
 ) -> None:
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    metadata = config_dir / "ansible_builtin_runtime.yml"
-    metadata.write_text(runtime_content)
-    core = CollectionInfo(
-        path=tmp_path,
-        namespace="ansible",
-        name="builtin",
-        full_name="ansible.builtin",
-        version="2.20.1",
-        is_ansible_core=True,
-    )
+    core = _create_core_info(tmp_path)
+    (tmp_path / "config" / "ansible_builtin_runtime.yml").write_text(runtime_content)
     with pytest.raises(ValueError, match=expected_error):
         load_routing_information(core)
 
@@ -620,108 +495,69 @@ plugin_routing:
 """)
     routing_info = load_routing_information(coll)
 
-    assert sorted(routing_info.plugin_data) == [
+    assert routing_info.plugin_data.keys() == {
         "eda_event_filter",
         "eda_event_source",
         "module",
-    ]
+    }
     assert routing_info.plugin_data["module"] == {
-        "formerly_core_ping": PluginRouting(
-            action_plugin=None,
+        "formerly_core_ping": _plugin_routing(
             redirect="testns.testcoll.ping",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
             tombstone=RemovalData(
                 warning_text="foo",
                 removal_version="1.2.3",
                 removal_date="2030-01-01",
             ),
         ),
-        "uses_redirected_action": PluginRouting(
-            action_plugin=None,
-            redirect="ansible.builtin.ping",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-        "foo": PluginRouting(
-            action_plugin=None,
-            redirect=None,
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-        "bar": PluginRouting(
-            action_plugin=None,
-            redirect=None,
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
-        "meh": PluginRouting(
-            action_plugin="foo",
-            redirect=None,
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
-            tombstone=None,
-        ),
+        "uses_redirected_action": _plugin_routing(redirect="ansible.builtin.ping"),
+        "foo": _EMPTY_PLUGIN_ROUTING,
+        "bar": _EMPTY_PLUGIN_ROUTING,
+        "meh": _plugin_routing(action_plugin="foo"),
     }
     assert routing_info.plugin_data["eda_event_source"] == {
-        "old_webhook": PluginRouting(
-            action_plugin=None,
-            redirect=None,
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
-            deprecation=None,
+        "old_webhook": _plugin_routing(
             tombstone=RemovalData(
                 warning_text="foo",
                 removal_version="2.0.0",
                 removal_date=None,
-            ),
+            )
         ),
     }
     assert routing_info.plugin_data["eda_event_filter"] == {
-        "legacy_filter": PluginRouting(
-            action_plugin=None,
+        "legacy_filter": _plugin_routing(
             redirect="foo.bar.baz",
-            redirect_chain=None,
-            redirect_deprecations=None,
-            redirect_tombstone=False,
-            redirect_dead_end=False,
-            redirect_error=None,
             deprecation=RemovalData(
                 warning_text="bar",
                 removal_version="3.0.0",
                 removal_date=None,
             ),
-            tombstone=None,
         ),
     }
 
 
+def test_load_routing_information_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    core = _create_core_info(tmp_path)
+    metadata = tmp_path / "config" / "ansible_builtin_runtime.yml"
+    metadata.write_text(CORE_ROUTING_YAML)
+    # Files modified very recently are not cached
+    os.utime(metadata, (1_000_000, 1_000_000))
+
+    loaded: list[Path] = []
+    load_yaml_file = _yaml.load_yaml_file
+
+    def counting_load_yaml_file(path: Path) -> t.Any:
+        loaded.append(path)
+        return load_yaml_file(path)
+
+    monkeypatch.setattr(_yaml, "load_yaml_file", counting_load_yaml_file)
+    for _ in range(2):
+        routing_info = load_routing_information(core)
+        assert routing_info.plugin_data == CORE_ROUTING_PLUGIN_DATA
+    assert loaded == [metadata]
+
+
 def test_collect_routing_information(tmp_path: Path) -> None:
     coll = CollectionInfo(
         path=tmp_path,
@@ -784,1282 +620,675 @@ plugin_routing: foo
     assert ri == {"foo.bar": CollectionRouting(plugin_data={"connection": {}})}
 
 
-@pytest.fixture(name="routing_info")
-def fixture_routing_info() -> Mapping[str, CollectionRouting]:
-    return {
-        "foo.bar": CollectionRouting(
-            plugin_data={
-                "module": {
-                    "baz": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "self_loop": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.self_loop",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "pre_loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.pre_loop_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "pre_loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_1",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="pre 2",
-                            removal_version=None,
-                            removal_date=None,
+@pytest.fixture(name="original_routing_info", scope="module")
+def fixture_original_routing_info() -> Mapping[str, CollectionRouting]:
+    return types.MappingProxyType(
+        {
+            "foo.bar": CollectionRouting(
+                plugin_data={
+                    "module": {
+                        "baz": _EMPTY_PLUGIN_ROUTING,
+                        "self_loop": _plugin_routing(redirect="foo.bar.self_loop"),
+                        "pre_loop_1": _plugin_routing(redirect="foo.bar.pre_loop_2"),
+                        "pre_loop_2": _plugin_routing(
+                            redirect="foo.bar.loop_1",
+                            deprecation=_removal_data("pre 2"),
                         ),
-                        tombstone=None,
-                    ),
-                    "loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="bar.baz.loop_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="loop 1",
-                            removal_version=None,
-                            removal_date=None,
+                        "loop_1": _plugin_routing(
+                            redirect="bar.baz.loop_2",
+                            deprecation=_removal_data("loop 1"),
                         ),
-                        tombstone=None,
-                    ),
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "loop_3": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_1",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="loop 3",
-                            removal_version=None,
-                            removal_date=None,
+                        "loop_2": _plugin_routing(redirect="foo.bar.loop_3"),
+                        "loop_3": _plugin_routing(
+                            redirect="foo.bar.loop_1",
+                            deprecation=_removal_data("loop 3"),
                         ),
-                        tombstone=None,
-                    ),
-                    "chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="foo 1",
-                            removal_version=None,
-                            removal_date=None,
+                        "chain_1": _plugin_routing(
+                            redirect="foo.bar.chain_2",
+                            deprecation=_removal_data("foo 1"),
                         ),
-                        tombstone=None,
-                    ),
-                    "chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_4",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="foo 3",
-                            removal_version=None,
-                            removal_date=None,
+                        "chain_2": _plugin_routing(redirect="foo.bar.chain_3"),
+                        "chain_3": _plugin_routing(
+                            redirect="foo.bar.chain_4",
+                            deprecation=_removal_data("foo 3"),
                         ),
-                        tombstone=None,
-                    ),
-                    "chain_4": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.leave_chain_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.leave_chain_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect="outside.here.meh",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                },
-                "lookup": {
-                    "loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "loop_3": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=("foo.bar.loop_3", "foo.bar.loop_3"),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "dead_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.dead_chain_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "dead_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.dead_chain_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "dead_chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=RemovalData(
-                            warning_text="this is dead",
-                            removal_version=None,
-                            removal_date=None,
+                        "chain_4": _EMPTY_PLUGIN_ROUTING,
+                        "leave_chain_1": _plugin_routing(
+                            redirect="foo.bar.leave_chain_2"
                         ),
-                    ),
-                    "broken_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.broken_chain_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "broken_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="this-is-not-a-fqcn",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
+                        "leave_chain_2": _plugin_routing(
+                            redirect="foo.bar.leave_chain_3"
+                        ),
+                        "leave_chain_3": _plugin_routing(redirect="outside.here.meh"),
+                    },
+                    "lookup": {
+                        "loop_1": _plugin_routing(redirect="foo.bar.loop_2"),
+                        "loop_2": _plugin_routing(redirect="foo.bar.loop_3"),
+                        "loop_3": _plugin_routing(
+                            redirect=...,
+                            redirect_chain=("foo.bar.loop_3", "foo.bar.loop_3"),
+                            redirect_error="Detected circular redirect",
+                        ),
+                        "dead_chain_1": _plugin_routing(
+                            redirect="foo.bar.dead_chain_2"
+                        ),
+                        "dead_chain_2": _plugin_routing(
+                            redirect="foo.bar.dead_chain_3"
+                        ),
+                        "dead_chain_3": _plugin_routing(
+                            tombstone=_removal_data("this is dead")
+                        ),
+                        "broken_chain_1": _plugin_routing(
+                            redirect="foo.bar.broken_chain_2"
+                        ),
+                        "broken_chain_2": _plugin_routing(
+                            redirect="this-is-not-a-fqcn"
+                        ),
+                    },
                 },
-            },
-        ),
-        "bar.baz": CollectionRouting(
-            plugin_data={
-                "module": {
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
+            ),
+            "bar.baz": CollectionRouting(
+                plugin_data={
+                    "module": {
+                        "loop_2": _plugin_routing(redirect="foo.bar.loop_3"),
+                        "chain_2": _plugin_routing(redirect="foo.bar.chain_3"),
+                    },
                 },
-            },
-        ),
+            ),
+        }
+    )
+
+
+def _copy_routing_info(
+    routing_info: Mapping[str, CollectionRouting],
+) -> dict[str, CollectionRouting]:
+    # PluginRouting objects are immutable, so only the containers that
+    # complete_redirects() modifies need to be copied
+    return {
+        collection_name: CollectionRouting(
+            plugin_data={
+                plugin_type: dict(plugins)
+                for plugin_type, plugins in collection_routing.plugin_data.items()
+            }
+        )
+        for collection_name, collection_routing in routing_info.items()
     }
 
 
-def test_complete_redirects(routing_info: Mapping[str, CollectionRouting]) -> None:
+@pytest.fixture(name="routing_info")
+def fixture_routing_info(
+    original_routing_info: Mapping[str, CollectionRouting],
+) -> Mapping[str, CollectionRouting]:
+    return _copy_routing_info(original_routing_info)
+
+
+@pytest.fixture(name="completed_routing_info", scope="module")
+def fixture_completed_routing_info(
+    original_routing_info: Mapping[str, CollectionRouting],
+) -> Mapping[str, CollectionRouting]:
+    routing_info = _copy_routing_info(original_routing_info)
     complete_redirects(routing_info)
-    assert routing_info == {
-        "foo.bar": CollectionRouting(
-            plugin_data={
-                "module": {
-                    "baz": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "self_loop": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.self_loop",
-                            "foo.bar.self_loop",
-                        ),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "pre_loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.pre_loop_1",
+    return routing_info
+
+
+COMPLETE_REDIRECTS_RESULT: dict[str, CollectionRouting] = {
+    "foo.bar": CollectionRouting(
+        plugin_data={
+            "module": {
+                "baz": _EMPTY_PLUGIN_ROUTING,
+                "self_loop": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "foo.bar.self_loop",
+                        "foo.bar.self_loop",
+                    ),
+                    redirect_error="Detected circular redirect",
+                ),
+                "pre_loop_1": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "foo.bar.pre_loop_1",
+                        "foo.bar.pre_loop_2",
+                        "foo.bar.loop_1",
+                        "bar.baz.loop_2",
+                        "foo.bar.loop_3",
+                        "foo.bar.loop_1",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.pre_loop_2",
+                            _removal_data("pre 2"),
+                        ),
+                        (
                             "foo.bar.loop_1",
-                            "bar.baz.loop_2",
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_1",
+                            _removal_data("loop 1"),
                         ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.pre_loop_2",
-                                RemovalData(
-                                    warning_text="pre 2",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
+                        (
+                            "foo.bar.loop_3",
+                            _removal_data("loop 3"),
                         ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
                     ),
-                    "pre_loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
+                    redirect_error="Detected circular redirect",
+                ),
+                "pre_loop_2": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "foo.bar.pre_loop_2",
+                        "foo.bar.loop_1",
+                        "bar.baz.loop_2",
+                        "foo.bar.loop_3",
+                        "foo.bar.loop_1",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.pre_loop_2",
-                            "foo.bar.loop_1",
-                            "bar.baz.loop_2",
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_1",
+                            _removal_data("pre 2"),
                         ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.pre_loop_2",
-                                RemovalData(
-                                    warning_text="pre 2",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
+                        (
+                            "foo.bar.loop_1",
+                            _removal_data("loop 1"),
                         ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=RemovalData(
-                            warning_text="pre 2",
-                            removal_version=None,
-                            removal_date=None,
+                        (
+                            "foo.bar.loop_3",
+                            _removal_data("loop 3"),
                         ),
-                        tombstone=None,
                     ),
-                    "loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.loop_1",
-                            "bar.baz.loop_2",
-                            "foo.bar.loop_3",
+                    redirect_error="Detected circular redirect",
+                    deprecation=_removal_data("pre 2"),
+                ),
+                "loop_1": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "foo.bar.loop_1",
+                        "bar.baz.loop_2",
+                        "foo.bar.loop_3",
+                        "foo.bar.loop_1",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.loop_1",
+                            _removal_data("loop 1"),
                         ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=RemovalData(
-                            warning_text="loop 1",
-                            removal_version=None,
-                            removal_date=None,
+                        (
+                            "foo.bar.loop_3",
+                            _removal_data("loop 3"),
                         ),
-                        tombstone=None,
                     ),
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.loop_2",
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_1",
-                            "bar.baz.loop_2",
+                    redirect_error="Detected circular redirect",
+                    deprecation=_removal_data("loop 1"),
+                ),
+                "loop_2": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "foo.bar.loop_2",
+                        "foo.bar.loop_3",
+                        "foo.bar.loop_1",
+                        "bar.baz.loop_2",
+                        "foo.bar.loop_3",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.loop_3",
+                            _removal_data("loop 3"),
                         ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
+                        (
+                            "foo.bar.loop_1",
+                            _removal_data("loop 1"),
                         ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
                     ),
-                    "loop_3": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_1",
-                            "bar.baz.loop_2",
+                    redirect_error="Detected circular redirect",
+                ),
+                "loop_3": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "foo.bar.loop_3",
+                        "foo.bar.loop_1",
+                        "bar.baz.loop_2",
+                        "foo.bar.loop_3",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.loop_3",
+                            _removal_data("loop 3"),
                         ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=RemovalData(
-                            warning_text="loop 3",
-                            removal_version=None,
-                            removal_date=None,
+                        (
+                            "foo.bar.loop_1",
+                            _removal_data("loop 1"),
                         ),
-                        tombstone=None,
                     ),
-                    "chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_4",
-                        redirect_chain=(
+                    redirect_error="Detected circular redirect",
+                    deprecation=_removal_data("loop 3"),
+                ),
+                "chain_1": _plugin_routing(
+                    redirect="foo.bar.chain_4",
+                    redirect_chain=(
+                        "foo.bar.chain_1",
+                        "foo.bar.chain_2",
+                        "foo.bar.chain_3",
+                        "foo.bar.chain_4",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.chain_1",
-                            "foo.bar.chain_2",
-                            "foo.bar.chain_3",
-                            "foo.bar.chain_4",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.chain_1",
-                                RemovalData(
-                                    warning_text="foo 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.chain_3",
-                                RemovalData(
-                                    warning_text="foo 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="foo 1",
-                            removal_version=None,
-                            removal_date=None,
+                            _removal_data("foo 1"),
                         ),
-                        tombstone=None,
-                    ),
-                    "chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_4",
-                        redirect_chain=(
-                            "foo.bar.chain_2",
+                        (
                             "foo.bar.chain_3",
-                            "foo.bar.chain_4",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.chain_3",
-                                RemovalData(
-                                    warning_text="foo 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
+                            _removal_data("foo 3"),
                         ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
                     ),
-                    "chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_4",
-                        redirect_chain=(
+                    deprecation=_removal_data("foo 1"),
+                ),
+                "chain_2": _plugin_routing(
+                    redirect="foo.bar.chain_4",
+                    redirect_chain=(
+                        "foo.bar.chain_2",
+                        "foo.bar.chain_3",
+                        "foo.bar.chain_4",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.chain_3",
-                            "foo.bar.chain_4",
+                            _removal_data("foo 3"),
                         ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.chain_3",
-                                RemovalData(
-                                    warning_text="foo 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="foo 3",
-                            removal_version=None,
-                            removal_date=None,
-                        ),
-                        tombstone=None,
-                    ),
-                    "chain_4": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="outside.here.meh",
-                        redirect_chain=(
-                            "foo.bar.leave_chain_1",
-                            "foo.bar.leave_chain_2",
-                            "foo.bar.leave_chain_3",
-                            "outside.here.meh",
-                        ),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=True,
-                        redirect_error="Found redirect to unknown collection outside.here",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="outside.here.meh",
-                        redirect_chain=(
-                            "foo.bar.leave_chain_2",
-                            "foo.bar.leave_chain_3",
-                            "outside.here.meh",
-                        ),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=True,
-                        redirect_error="Found redirect to unknown collection outside.here",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect="outside.here.meh",
-                        redirect_chain=(
-                            "foo.bar.leave_chain_3",
-                            "outside.here.meh",
-                        ),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=True,
-                        redirect_error="Found redirect to unknown collection outside.here",
-                        deprecation=None,
-                        tombstone=None,
                     ),
-                },
-                "lookup": {
-                    "loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.loop_1",
-                            "foo.bar.loop_2",
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_3",
-                        ),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.loop_2",
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_3",
-                        ),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "loop_3": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=("foo.bar.loop_3", "foo.bar.loop_3"),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "dead_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.dead_chain_3",
-                        redirect_chain=(
-                            "foo.bar.dead_chain_1",
-                            "foo.bar.dead_chain_2",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.dead_chain_3",
-                                RemovalData(
-                                    warning_text="this is dead",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=True,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "dead_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.dead_chain_3",
-                        redirect_chain=("foo.bar.dead_chain_2",),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.dead_chain_3",
-                                RemovalData(
-                                    warning_text="this is dead",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
+                ),
+                "chain_3": _plugin_routing(
+                    redirect="foo.bar.chain_4",
+                    redirect_chain=(
+                        "foo.bar.chain_3",
+                        "foo.bar.chain_4",
+                    ),
+                    redirect_deprecations=(
+                        (
+                            "foo.bar.chain_3",
+                            _removal_data("foo 3"),
                         ),
-                        redirect_tombstone=True,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
                     ),
-                    "dead_chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=RemovalData(
-                            warning_text="this is dead",
-                            removal_version=None,
-                            removal_date=None,
+                    deprecation=_removal_data("foo 3"),
+                ),
+                "chain_4": _EMPTY_PLUGIN_ROUTING,
+                "leave_chain_1": _plugin_routing(
+                    redirect="outside.here.meh",
+                    redirect_chain=(
+                        "foo.bar.leave_chain_1",
+                        "foo.bar.leave_chain_2",
+                        "foo.bar.leave_chain_3",
+                        "outside.here.meh",
+                    ),
+                    redirect_dead_end=True,
+                    redirect_error="Found redirect to unknown collection outside.here",
+                ),
+                "leave_chain_2": _plugin_routing(
+                    redirect="outside.here.meh",
+                    redirect_chain=(
+                        "foo.bar.leave_chain_2",
+                        "foo.bar.leave_chain_3",
+                        "outside.here.meh",
+                    ),
+                    redirect_dead_end=True,
+                    redirect_error="Found redirect to unknown collection outside.here",
+                ),
+                "leave_chain_3": _plugin_routing(
+                    redirect="outside.here.meh",
+                    redirect_chain=(
+                        "foo.bar.leave_chain_3",
+                        "outside.here.meh",
+                    ),
+                    redirect_dead_end=True,
+                    redirect_error="Found redirect to unknown collection outside.here",
+                ),
+            },
+            "lookup": {
+                "loop_1": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "foo.bar.loop_1",
+                        "foo.bar.loop_2",
+                        "foo.bar.loop_3",
+                        "foo.bar.loop_3",
+                    ),
+                    redirect_error="Detected circular redirect",
+                ),
+                "loop_2": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "foo.bar.loop_2",
+                        "foo.bar.loop_3",
+                        "foo.bar.loop_3",
+                    ),
+                    redirect_error="Detected circular redirect",
+                ),
+                "loop_3": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=("foo.bar.loop_3", "foo.bar.loop_3"),
+                    redirect_error="Detected circular redirect",
+                ),
+                "dead_chain_1": _plugin_routing(
+                    redirect="foo.bar.dead_chain_3",
+                    redirect_chain=(
+                        "foo.bar.dead_chain_1",
+                        "foo.bar.dead_chain_2",
+                    ),
+                    redirect_deprecations=(
+                        (
+                            "foo.bar.dead_chain_3",
+                            _removal_data("this is dead"),
                         ),
                     ),
-                    "broken_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="this-is-not-a-fqcn",
-                        redirect_chain=(
-                            "foo.bar.broken_chain_1",
-                            "foo.bar.broken_chain_2",
+                    redirect_tombstone=True,
+                ),
+                "dead_chain_2": _plugin_routing(
+                    redirect="foo.bar.dead_chain_3",
+                    redirect_chain=("foo.bar.dead_chain_2",),
+                    redirect_deprecations=(
+                        (
+                            "foo.bar.dead_chain_3",
+                            _removal_data("this is dead"),
                         ),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=True,
-                        redirect_error="Found redirect to non-FQCN this-is-not-a-fqcn",
-                        deprecation=None,
-                        tombstone=None,
                     ),
-                    "broken_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="this-is-not-a-fqcn",
-                        redirect_chain=("foo.bar.broken_chain_2",),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=True,
-                        redirect_error="Found redirect to non-FQCN this-is-not-a-fqcn",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                },
+                    redirect_tombstone=True,
+                ),
+                "dead_chain_3": _plugin_routing(
+                    tombstone=_removal_data("this is dead")
+                ),
+                "broken_chain_1": _plugin_routing(
+                    redirect="this-is-not-a-fqcn",
+                    redirect_chain=(
+                        "foo.bar.broken_chain_1",
+                        "foo.bar.broken_chain_2",
+                    ),
+                    redirect_dead_end=True,
+                    redirect_error="Found redirect to non-FQCN this-is-not-a-fqcn",
+                ),
+                "broken_chain_2": _plugin_routing(
+                    redirect="this-is-not-a-fqcn",
+                    redirect_chain=("foo.bar.broken_chain_2",),
+                    redirect_dead_end=True,
+                    redirect_error="Found redirect to non-FQCN this-is-not-a-fqcn",
+                ),
             },
-        ),
-        "bar.baz": CollectionRouting(
-            plugin_data={
-                "module": {
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "bar.baz.loop_2",
+        },
+    ),
+    "bar.baz": CollectionRouting(
+        plugin_data={
+            "module": {
+                "loop_2": _plugin_routing(
+                    redirect=...,
+                    redirect_chain=(
+                        "bar.baz.loop_2",
+                        "foo.bar.loop_3",
+                        "foo.bar.loop_1",
+                        "bar.baz.loop_2",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.loop_3",
-                            "foo.bar.loop_1",
-                            "bar.baz.loop_2",
+                            _removal_data("loop 3"),
                         ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
+                        (
+                            "foo.bar.loop_1",
+                            _removal_data("loop 1"),
                         ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
                     ),
-                    "chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_4",
-                        redirect_chain=(
-                            "bar.baz.chain_2",
+                    redirect_error="Detected circular redirect",
+                ),
+                "chain_2": _plugin_routing(
+                    redirect="foo.bar.chain_4",
+                    redirect_chain=(
+                        "bar.baz.chain_2",
+                        "foo.bar.chain_3",
+                        "foo.bar.chain_4",
+                    ),
+                    redirect_deprecations=(
+                        (
                             "foo.bar.chain_3",
-                            "foo.bar.chain_4",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.chain_3",
-                                RemovalData(
-                                    warning_text="foo 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
+                            _removal_data("foo 3"),
                         ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
                     ),
-                },
+                ),
             },
+        },
+    ),
+}
+
+COMPLETE_REDIRECTS_CASES: list[tuple[str, PluginType, str]] = [
+    (collection_name, plugin_type, plugin_name)
+    for collection_name, collection_routing in COMPLETE_REDIRECTS_RESULT.items()
+    for plugin_type, plugins in collection_routing.plugin_data.items()
+    for plugin_name in plugins
+]
+
+
+def test_complete_redirects(
+    completed_routing_info: Mapping[str, CollectionRouting],
+) -> None:
+    assert {
+        (collection_name, plugin_type, plugin_name)
+        for collection_name, collection_routing in completed_routing_info.items()
+        for plugin_type, plugins in collection_routing.plugin_data.items()
+        for plugin_name in plugins
+    } == set(COMPLETE_REDIRECTS_CASES)
+
+
+@pytest.mark.parametrize(
+    "collection_name, plugin_type, plugin_name",
+    COMPLETE_REDIRECTS_CASES,
+    ids=[".".join(case) for case in COMPLETE_REDIRECTS_CASES],
+)
+def test_complete_redirects_plugin(
+    collection_name: str,
+    plugin_type: PluginType,
+    plugin_name: str,
+    completed_routing_info: Mapping[str, CollectionRouting],
+) -> None:
+    plugin_data = completed_routing_info[collection_name].plugin_data[plugin_type]
+    expected = COMPLETE_REDIRECTS_RESULT[collection_name].plugin_data[plugin_type]
+    assert plugin_data[plugin_name] == expected[plugin_name]
+
+
+@pytest.mark.parametrize(
+    "order",
+    [
+        ["x", "y", "z", "w"],
+        ["y", "x", "z", "w"],
+        ["z", "y", "x", "w"],
+    ],
+    ids=["start-first", "middle-first", "end-first"],
+)
+def test_complete_redirects_partially_completed_chain(order: list[str]) -> None:
+    # Plugins whose chain runs through an already completed plugin must get
+    # the full chain, independent of the order in which plugins are processed
+    plugins = {
+        "x": _plugin_routing(redirect="a.b.y"),
+        "y": _plugin_routing(redirect="a.b.z"),
+        "z": _plugin_routing(redirect="a.b.w", deprecation=_removal_data("z")),
+        "w": _EMPTY_PLUGIN_ROUTING,
+    }
+    routing_info = {
+        "a.b": CollectionRouting(
+            plugin_data={"module": {name: plugins[name] for name in order}}
+        )
+    }
+    complete_redirects(routing_info)
+    z_deprecation = (("a.b.z", _removal_data("z")),)
+    assert routing_info["a.b"].plugin_data["module"] == {
+        "x": _plugin_routing(
+            redirect="a.b.w",
+            redirect_chain=("a.b.x", "a.b.y", "a.b.z", "a.b.w"),
+            redirect_deprecations=z_deprecation,
+        ),
+        "y": _plugin_routing(
+            redirect="a.b.w",
+            redirect_chain=("a.b.y", "a.b.z", "a.b.w"),
+            redirect_deprecations=z_deprecation,
+        ),
+        "z": _plugin_routing(
+            redirect="a.b.w",
+            redirect_chain=("a.b.z", "a.b.w"),
+            redirect_deprecations=z_deprecation,
+            deprecation=_removal_data("z"),
         ),
+        "w": _EMPTY_PLUGIN_ROUTING,
     }
 
 
-def test_complete_redirects_for_collection(
-    routing_info: Mapping[str, CollectionRouting],
+_PLUGIN_ROUTING_FIELDS = tuple(
+    field.name for field in dataclasses.fields(PluginRouting)
+)
+
+
+def _assert_routing_equal(
+    actual: Mapping[str, CollectionRouting],
+    expected: Mapping[str, CollectionRouting],
 ) -> None:
-    original = copy.deepcopy(routing_info)
-    complete_redirects_for_collection(routing_info, collection_name="does-not-exist")
-    assert original == routing_info
+    # Compare field by field so that a failure names the plugin and the field
+    # that differ, and skip everything that the code under test left untouched
+    assert actual.keys() == expected.keys()
+    for collection_name, expected_routing in expected.items():
+        actual_routing = actual[collection_name]
+        if actual_routing is expected_routing:
+            continue
+        assert actual_routing.plugin_data.keys() == expected_routing.plugin_data.keys()
+        for plugin_type, expected_plugins in expected_routing.plugin_data.items():
+            actual_plugins = actual_routing.plugin_data[plugin_type]
+            assert actual_plugins.keys() == expected_plugins.keys()
+            for plugin_name, expected_plugin in expected_plugins.items():
+                actual_plugin = actual_plugins[plugin_name]
+                if actual_plugin is expected_plugin:
+                    continue
+                for field in _PLUGIN_ROUTING_FIELDS:
+                    assert getattr(actual_plugin, field) == getattr(
+                        expected_plugin, field
+                    ), f"{collection_name} {plugin_type} {plugin_name} {field}"
 
-    complete_redirects_for_collection(routing_info, collection_name="bar.baz")
-    assert routing_info == {
-        "foo.bar": CollectionRouting(
-            plugin_data={
-                "module": {
-                    "baz": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "self_loop": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.self_loop",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "pre_loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.pre_loop_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "pre_loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_1",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="pre 2",
-                            removal_version=None,
-                            removal_date=None,
-                        ),
-                        tombstone=None,
-                    ),
-                    "loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.loop_1",
-                            "bar.baz.loop_2",
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_1",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=RemovalData(
-                            warning_text="loop 1",
-                            removal_version=None,
-                            removal_date=None,
-                        ),
-                        tombstone=None,
-                    ),
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "loop_3": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_1",
-                            "bar.baz.loop_2",
-                            "foo.bar.loop_3",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=RemovalData(
-                            warning_text="loop 3",
-                            removal_version=None,
-                            removal_date=None,
-                        ),
-                        tombstone=None,
-                    ),
-                    "chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="foo 1",
-                            removal_version=None,
-                            removal_date=None,
-                        ),
-                        tombstone=None,
-                    ),
-                    "chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_4",
-                        redirect_chain=(
-                            "foo.bar.chain_3",
-                            "foo.bar.chain_4",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.chain_3",
-                                RemovalData(
-                                    warning_text="foo 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=RemovalData(
-                            warning_text="foo 3",
-                            removal_version=None,
-                            removal_date=None,
-                        ),
-                        tombstone=None,
-                    ),
-                    "chain_4": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.leave_chain_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.leave_chain_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "leave_chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect="outside.here.meh",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                },
-                "lookup": {
-                    "loop_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.loop_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "loop_3": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=("foo.bar.loop_3", "foo.bar.loop_3"),
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "dead_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.dead_chain_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "dead_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.dead_chain_3",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "dead_chain_3": PluginRouting(
-                        action_plugin=None,
-                        redirect=None,
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=RemovalData(
-                            warning_text="this is dead",
-                            removal_version=None,
-                            removal_date=None,
-                        ),
-                    ),
-                    "broken_chain_1": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.broken_chain_2",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "broken_chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="this-is-not-a-fqcn",
-                        redirect_chain=None,
-                        redirect_deprecations=None,
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                },
-            },
+
+def _apply_overrides(
+    routing_info: Mapping[str, CollectionRouting],
+    overrides: Mapping[tuple[str, PluginType, str], Mapping[str, t.Any]],
+) -> dict[str, CollectionRouting]:
+    result = _copy_routing_info(routing_info)
+    for (collection_name, plugin_type, plugin_name), fields in overrides.items():
+        plugins = result[collection_name].plugin_data[plugin_type]
+        plugins[plugin_name] = dataclasses.replace(plugins[plugin_name], **fields)
+    return result
+
+
+# The plugins changed by completing the redirects of bar.baz, and how
+COMPLETE_BAR_BAZ_REDIRECTS_OVERRIDES: dict[
+    tuple[str, PluginType, str], dict[str, t.Any]
+] = {
+    ("foo.bar", "module", "loop_1"): {
+        "redirect": ...,
+        "redirect_chain": (
+            "foo.bar.loop_1",
+            "bar.baz.loop_2",
+            "foo.bar.loop_3",
+            "foo.bar.loop_1",
         ),
-        "bar.baz": CollectionRouting(
-            plugin_data={
-                "module": {
-                    "loop_2": PluginRouting(
-                        action_plugin=None,
-                        redirect=...,
-                        redirect_chain=(
-                            "bar.baz.loop_2",
-                            "foo.bar.loop_3",
-                            "foo.bar.loop_1",
-                            "bar.baz.loop_2",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.loop_3",
-                                RemovalData(
-                                    warning_text="loop 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                            (
-                                "foo.bar.loop_1",
-                                RemovalData(
-                                    warning_text="loop 1",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error="Detected circular redirect",
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                    "chain_2": PluginRouting(
-                        action_plugin=None,
-                        redirect="foo.bar.chain_4",
-                        redirect_chain=(
-                            "bar.baz.chain_2",
-                            "foo.bar.chain_3",
-                            "foo.bar.chain_4",
-                        ),
-                        redirect_deprecations=(
-                            (
-                                "foo.bar.chain_3",
-                                RemovalData(
-                                    warning_text="foo 3",
-                                    removal_version=None,
-                                    removal_date=None,
-                                ),
-                            ),
-                        ),
-                        redirect_tombstone=False,
-                        redirect_dead_end=False,
-                        redirect_error=None,
-                        deprecation=None,
-                        tombstone=None,
-                    ),
-                },
-            },
+        "redirect_deprecations": (
+            (
+                "foo.bar.loop_1",
+                _removal_data("loop 1"),
+            ),
+            (
+                "foo.bar.loop_3",
+                _removal_data("loop 3"),
+            ),
         ),
-    }
+        "redirect_error": "Detected circular redirect",
+    },
+    ("foo.bar", "module", "loop_3"): {
+        "redirect": ...,
+        "redirect_chain": (
+            "foo.bar.loop_3",
+            "foo.bar.loop_1",
+            "bar.baz.loop_2",
+            "foo.bar.loop_3",
+        ),
+        "redirect_deprecations": (
+            (
+                "foo.bar.loop_3",
+                _removal_data("loop 3"),
+            ),
+            (
+                "foo.bar.loop_1",
+                _removal_data("loop 1"),
+            ),
+        ),
+        "redirect_error": "Detected circular redirect",
+    },
+    ("foo.bar", "module", "chain_3"): {
+        "redirect_chain": (
+            "foo.bar.chain_3",
+            "foo.bar.chain_4",
+        ),
+        "redirect_deprecations": (
+            (
+                "foo.bar.chain_3",
+                _removal_data("foo 3"),
+            ),
+        ),
+    },
+    ("bar.baz", "module", "loop_2"): {
+        "redirect": ...,
+        "redirect_chain": (
+            "bar.baz.loop_2",
+            "foo.bar.loop_3",
+            "foo.bar.loop_1",
+            "bar.baz.loop_2",
+        ),
+        "redirect_deprecations": (
+            (
+                "foo.bar.loop_3",
+                _removal_data("loop 3"),
+            ),
+            (
+                "foo.bar.loop_1",
+                _removal_data("loop 1"),
+            ),
+        ),
+        "redirect_error": "Detected circular redirect",
+    },
+    ("bar.baz", "module", "chain_2"): {
+        "redirect": "foo.bar.chain_4",
+        "redirect_chain": (
+            "bar.baz.chain_2",
+            "foo.bar.chain_3",
+            "foo.bar.chain_4",
+        ),
+        "redirect_deprecations": (
+            (
+                "foo.bar.chain_3",
+                _removal_data("foo 3"),
+            ),
+        ),
+    },
+}
+
+
+COMPLETE_REDIRECTS_FOR_COLLECTION_DATA: list[
+    tuple[str, Mapping[tuple[str, PluginType, str], Mapping[str, t.Any]]]
+] = [
+    ("does-not-exist", {}),
+    ("bar.baz", COMPLETE_BAR_BAZ_REDIRECTS_OVERRIDES),
+]
+
+
+@pytest.mark.parametrize(
+    "collection_name, overrides",
+    COMPLETE_REDIRECTS_FOR_COLLECTION_DATA,
+    ids=[
+        collection_name for collection_name, _ in COMPLETE_REDIRECTS_FOR_COLLECTION_DATA
+    ],
+)
+def test_complete_redirects_for_collection(
+    collection_name: str,
+    overrides: Mapping[tuple[str, PluginType, str], Mapping[str, t.Any]],
+    original_routing_info: Mapping[str, CollectionRouting],
+    routing_info: Mapping[str, CollectionRouting],
+) -> None:
+    complete_redirects_for_collection(routing_info, collection_name=collection_name)
+    _assert_routing_equal(
+        routing_info, _apply_overrides(original_routing_info, overrides)
+    )
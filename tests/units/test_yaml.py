@@ -0,0 +1,88 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt
+# or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+"""
+Test YAML loading code.
+"""
+
+from __future__ import annotations
+
+import collections
+import os
+from pathlib import Path
+
+import pytest  # pylint: disable=import-error
+import yaml
+
+from antsibull_docs_loader import _yaml
+from antsibull_docs_loader._yaml import load_yaml_file_cached
+
+
+def test_load_yaml_file_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_yaml, "_CACHE", collections.OrderedDict())
+    path = tmp_path / "test.yml"
+    path.write_text("a: 1\n")
+    # Recently modified files are not cached
+    first = load_yaml_file_cached(path)
+    assert first == {"a": 1}
+    assert load_yaml_file_cached(path) is not first
+
+    os.utime(path, (1_000_000, 1_000_000))
+    first = load_yaml_file_cached(path)
+    assert first == {"a": 1}
+    assert load_yaml_file_cached(path) is first
+
+    # Changes in size or modification time invalidate the cached result
+    path.write_text("a: 23\n")
+    os.utime(path, (1_000_000, 1_000_000))
+    assert load_yaml_file_cached(path) == {"a": 23}
+    path.write_text("a: 42\n")
+    os.utime(path, (2_000_000, 2_000_000))
+    assert load_yaml_file_cached(path) == {"a": 42}
+
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        load_yaml_file_cached(path)
+
+
+def test_load_yaml_file_cached_relative_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_yaml, "_CACHE", collections.OrderedDict())
+    for name, content in (("a", "a: 1\n"), ("b", "a: 2\n")):
+        (tmp_path / name).mkdir()
+        path = tmp_path / name / "test.yml"
+        path.write_text(content)
+        os.utime(path, (1_000_000, 1_000_000))
+    # The same relative path refers to different files after changing directories
+    monkeypatch.chdir(tmp_path / "a")
+    assert load_yaml_file_cached(Path("test.yml")) == {"a": 1}
+    monkeypatch.chdir(tmp_path / "b")
+    assert load_yaml_file_cached(Path("test.yml")) == {"a": 2}
+
+
+def test_load_yaml_file_cached_evicts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_yaml, "_CACHE", collections.OrderedDict())
+    monkeypatch.setattr(_yaml, "_CACHE_SIZE", 2)
+    paths = [tmp_path / f"test{index}.yml" for index in range(3)]
+    for index, path in enumerate(paths):
+        path.write_text(f"a: {index}\n")
+        os.utime(path, (1_000_000, 1_000_000))
+    first = [load_yaml_file_cached(path) for path in paths[:2]]
+    # Using the first file makes the second one the least recently used
+    assert load_yaml_file_cached(paths[0]) is first[0]
+    load_yaml_file_cached(paths[2])
+    assert len(_yaml._CACHE) == 2  # pylint: disable=protected-access
+    assert load_yaml_file_cached(paths[0]) is first[0]
+    assert load_yaml_file_cached(paths[1]) is not first[1]
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+def test_uses_libyaml() -> None:
+    # pylint: disable-next=protected-access
+    assert _yaml._SafeLoader is yaml.CSafeLoader